@@ -0,0 +1,92 @@
+"""
+Before/after comparison of the original path-copying BFS and the shared
+parent-pointer BFS in waterwise.solver.
+
+Run from the repository root:
+
+    python -m benchmarks.compare_path_copy
+"""
+
+import time
+import tracemalloc
+
+from waterwise.solver import solve
+
+
+def path_copy_solve(capacities, target):
+    """
+    The BFS as it was written in the original front ends: every enqueue copies
+    the whole path and formats the action text, and duplicates are only
+    rejected when they are dequeued.
+    """
+    num_jugs = len(capacities)
+    visited = set()
+    queue = [(tuple([0] * num_jugs), [])]
+
+    while queue:
+        state, path = queue.pop(0)
+        if state in visited:
+            continue
+        visited.add(state)
+
+        if all(state[i] == target.get(i, 0) for i in range(num_jugs)):
+            return path
+
+        for i in range(num_jugs):
+            if state[i] < capacities[i]:
+                new_state = list(state)
+                new_state[i] = capacities[i]
+                queue.append((tuple(new_state), path + [(f"Fill jug {chr(65+i)}", new_state)]))
+
+            if state[i] > 0:
+                new_state = list(state)
+                new_state[i] = 0
+                queue.append((tuple(new_state), path + [(f"Empty jug {chr(65+i)}", new_state)]))
+
+            for j in range(num_jugs):
+                if i != j and state[i] > 0 and state[j] < capacities[j]:
+                    new_state = list(state)
+                    amount = min(state[i], capacities[j] - state[j])
+                    new_state[i] -= amount
+                    new_state[j] += amount
+                    queue.append((tuple(new_state), path + [(f"Pour {amount}L from jug {chr(65+i)} to jug {chr(65+j)}", new_state)]))
+
+    return None
+
+
+# (name, capacities, target) - kept small enough for the old BFS to finish
+PUZZLES = [
+    ("classic 3/5", (3, 5), {1: 4}),
+    ("3 jugs 8/5/3", (8, 5, 3), {0: 4, 1: 4}),
+    ("4 jugs", (11, 7, 5, 3), {0: 1, 1: 7, 2: 2}),
+    ("5 jugs", (13, 11, 7, 5, 3), {0: 6, 2: 1, 4: 2}),
+]
+
+
+def measure(function, *args):
+    """
+    Runs function(*args) and returns (result, seconds, peak bytes allocated).
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    print(f"{'Puzzle':^14} | {'Steps':^5} | {'Old time':^10} | {'New time':^10} | {'Old peak':^10} | {'New peak':^10}")
+    print("-" * 75)
+    for name, capacities, target in PUZZLES:
+        old, old_time, old_peak = measure(path_copy_solve, capacities, target)
+        new, new_time, new_peak = measure(solve, capacities, target)
+        assert (old is None) == (new is None) and len(old or []) == len(new or []), name
+        steps = len(new) if new is not None else "-"
+        print(f"{name:^14} | {steps:^5} | {old_time:9.3f}s | {new_time:9.3f}s | "
+              f"{old_peak / 1024:8.0f}KB | {new_peak / 1024:8.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Benchmark suite for the search engines in waterwise.solver.
+
+Every search method is run over named families of puzzles, recording wall
+time, peak memory, states expanded and the queue high-water mark. The results
+are written as a JSON report and compared with a stored baseline; the run
+fails (exit status 1) when the move count changes or the states expanded or
+the queue high-water mark grow by more than the threshold. These counts are
+the same on every run. Wall time and memory depend on the machine and its
+load, so they only fail the run with --check-resources.
+
+Run from the repository root:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --family deep-solution --methods bfs astar
+    python -m benchmarks.suite --output report.json --threshold 0.5
+    python -m benchmarks.suite --check-resources
+    python -m benchmarks.suite --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from waterwise import reachability
+from waterwise.solver import SEARCH_METHODS, solve
+from waterwise.stats import SearchStats
+
+# family name -> list of (puzzle name, capacities, target, start or None)
+FAMILIES = {
+    "classic-2-jug": [
+        ("3/5 to 4", (3, 5), {1: 4}, None),
+        ("4/9 to 6", (4, 9), {1: 6}, None),
+        ("7/11 to 6", (7, 11), {0: 6}, None),
+    ],
+    "five-jug-large": [
+        ("19/17/13/11/7", (19, 17, 13, 11, 7), {0: 6, 1: 3, 2: 1, 4: 2}, None),
+        ("40/37/23/17/11", (40, 37, 23, 17, 11), {0: 1, 1: 3, 3: 5}, None),
+    ],
+    # Targets that pass the pre-check but cannot be reached, so the search
+    # has to explore every reachable state before giving up
+    "unsolvable": [
+        ("10..50 from 1L", (10, 20, 30, 40, 50), {0: 3}, (1, 0, 0, 0, 0)),
+        ("12..36 from 1L", (12, 18, 24, 30, 36), {0: 2, 4: 36}, (1, 0, 0, 0, 0)),
+    ],
+    "deep-solution": [
+        ("97/98 to 49", (97, 98), {1: 49}, None),
+        ("50/51/52", (50, 51, 52), {0: 26, 1: 51, 2: 27}, None),
+    ],
+    # Jugs sharing a capacity and a target, where "bfs" uses symmetry reduction
+    "interchangeable-jugs": [
+        ("4x9 + 4", (9, 9, 9, 9, 4), {0: 3, 1: 3, 2: 3, 3: 3}, None),
+        ("3x30 + 7", (30, 30, 30, 7), {0: 1, 1: 1, 2: 1}, None),
+    ],
+}
+
+# Methods run when none are given; "cached" builds the whole reachability map
+# and "numpy" needs NumPy, so they are only run on request
+DEFAULT_METHODS = ["bfs", "bidirectional", "astar"]
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Measurements compared with the baseline, and the smallest increase of each
+# that counts as a regression. The search counts are deterministic, so any
+# growth over the threshold counts.
+METRICS = {
+    "expanded": 0,
+    "peak_queue": 0,
+}
+
+# Measurements that vary from run to run, only compared with --check-resources.
+# Their floors ignore timer and allocator noise on small puzzles.
+RESOURCE_METRICS = {
+    "seconds": 0.05,
+    "peak_memory": 256 * 1024,
+}
+
+
+def run_once(capacities, target, start, method, stats=None):
+    """
+    Solves one puzzle from scratch. The reachability cache is cleared first so
+    the "cached" method is always measured building its map.
+    """
+    reachability.cache.clear()
+    return solve(capacities, target, start=start, method=method, stats=stats)
+
+
+def measure(capacities, target, start, method, repeat):
+    """
+    Benchmarks one method on one puzzle and returns its results as a dictionary.
+    The time is the best of repeat runs; memory is measured in a separate run,
+    since tracing allocations slows the search down.
+    """
+    stats = SearchStats()
+    solution = run_once(capacities, target, start, method, stats)
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_once(capacities, target, start, method)
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+
+    tracemalloc.start()
+    run_once(capacities, target, start, method)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "moves": None if solution is None else len(solution),
+        "seconds": round(best, 6),
+        "peak_memory": peak,
+        "expanded": stats.expanded,
+        "peak_queue": stats.peak_queue,
+    }
+
+
+def run_suite(families, methods, repeat=3, log=sys.stderr):
+    """
+    Runs every method over every puzzle of the given families.
+    Returns the report dictionary; progress lines are written to log.
+    """
+    results = []
+    for family in families:
+        for name, capacities, target, start in FAMILIES[family]:
+            for method in methods:
+                try:
+                    result = measure(capacities, target, start, method, repeat)
+                except ImportError as e:
+                    print(f"{family} / {name} / {method}: skipped ({e})", file=log)
+                    continue
+                result = {"family": family, "puzzle": name, "method": method, **result}
+                results.append(result)
+                print(f"{family} / {name} / {method}: {result['moves']} moves, {result['seconds']:.4f}s, "
+                      f"{result['peak_memory'] / 1024:.0f}KB, {result['expanded']} expanded, "
+                      f"queue {result['peak_queue']}", file=log)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def find_regressions(report, baseline, threshold, metrics=METRICS):
+    """
+    Compares a report with a baseline report. Returns a list of messages, one
+    per changed move count and per measurement in metrics that grew by more
+    than threshold (0.25 = 25%) and by more than its noise floor. Results
+    missing from either report are skipped.
+    """
+    previous = {(r["family"], r["puzzle"], r["method"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["family"], result["puzzle"], result["method"]))
+        if old is None:
+            continue
+        if old["moves"] != result["moves"]:
+            regressions.append(f"{result['family']} / {result['puzzle']} / {result['method']}: "
+                               f"{result['moves']} moves, baseline {old['moves']}")
+        for metric, floor in metrics.items():
+            new_value = result[metric]
+            old_value = old[metric]
+            if new_value > old_value * (1 + threshold) and new_value - old_value > floor:
+                regressions.append(f"{result['family']} / {result['puzzle']} / {result['method']}: "
+                                   f"{metric} {new_value} vs baseline {old_value}")
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point of the benchmark suite.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Water Jug search engines")
+    parser.add_argument("--family", choices=list(FAMILIES), action="append",
+                        help="puzzle family to run (repeatable, default: all)")
+    parser.add_argument("--methods", choices=list(SEARCH_METHODS), nargs="+", default=DEFAULT_METHODS,
+                        help=f"search methods to run (default: {' '.join(DEFAULT_METHODS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement; the best is kept")
+    parser.add_argument("--output", default=None, help="file to write the JSON report to (default: stdout)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline report to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed growth of any measurement over the baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--check-resources", action="store_true",
+                        help="also fail when wall time or peak memory grows by more than the threshold")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the new baseline instead of comparing with it")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.family or list(FAMILIES), args.methods, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(text + "\n")
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one", file=sys.stderr)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    metrics = {**METRICS, **RESOURCE_METRICS} if args.check_resources else METRICS
+    regressions = find_regressions(report, baseline, args.threshold, metrics)
+    for message in regressions:
+        print(f"REGRESSION: {message}", file=sys.stderr)
+    if regressions:
+        return 1
+    print("No regressions against the baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
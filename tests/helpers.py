@@ -0,0 +1,45 @@
+"""
+Shared helpers for the tests: random puzzles and a brute-force BFS to check
+the solvers against.
+"""
+
+from collections import deque
+
+
+def random_puzzles(rng, count, max_jugs=3, max_capacity=7):
+    """
+    Yields count random (capacities, start, goal) puzzles. Start and goal are
+    any levels that fit the jugs, so some goals are unreachable.
+    """
+    for _ in range(count):
+        capacities = tuple(rng.randint(1, max_capacity) for _ in range(rng.randint(1, max_jugs)))
+        start = tuple(rng.randint(0, c) for c in capacities)
+        goal = tuple(rng.randint(0, c) for c in capacities)
+        yield capacities, start, goal
+
+
+def brute_force_distances(capacities, start):
+    """
+    Returns {state: fewest moves from start} for every reachable state, found
+    with a plain BFS over level tuples that shares no code with waterwise.
+    """
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        following = []
+        for i, capacity in enumerate(capacities):
+            following.append(state[:i] + (capacity,) + state[i + 1:])
+            following.append(state[:i] + (0,) + state[i + 1:])
+            for j in range(len(capacities)):
+                if i != j:
+                    amount = min(state[i], capacities[j] - state[j])
+                    levels = list(state)
+                    levels[i] -= amount
+                    levels[j] += amount
+                    following.append(tuple(levels))
+        for new_state in following:
+            if new_state not in distances:
+                distances[new_state] = distances[state] + 1
+                queue.append(new_state)
+    return distances
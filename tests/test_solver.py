@@ -0,0 +1,103 @@
+"""
+Cross-checks every search method against a brute-force BFS.
+"""
+
+import importlib.util
+import random
+import unittest
+
+from tests.helpers import brute_force_distances, random_puzzles
+from waterwise.recording import apply_code, move_code
+from waterwise.solver import SEARCH_METHODS, solve
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class SearchMethodTests(unittest.TestCase):
+    def check_solution(self, capacities, start, goal, solution, distances):
+        """
+        Asserts that solution is a legal, shortest path from start to goal, or
+        None exactly when the brute-force BFS cannot reach goal.
+        """
+        if goal not in distances:
+            self.assertIsNone(solution)
+            return
+        self.assertIsNotNone(solution)
+        self.assertEqual(len(solution), distances[goal])
+        state = start
+        for move, after in solution:
+            self.assertEqual(apply_code(state, move_code(move), capacities), (move, after))
+            state = after
+        self.assertEqual(state, goal)
+
+    def check_method(self, method):
+        rng = random.Random(method)
+        for capacities, start, goal in random_puzzles(rng, 150):
+            distances = brute_force_distances(capacities, start)
+            with self.subTest(capacities=capacities, start=start, goal=goal):
+                solution = SEARCH_METHODS[method](capacities, start, goal)
+                if start == goal:
+                    self.assertEqual(solution, [])
+                else:
+                    self.check_solution(capacities, start, goal, solution, distances)
+                target = {i: level for i, level in enumerate(goal) if level}
+                self.check_solution(capacities, start, goal, solve(capacities, target, start, method), distances)
+
+    def test_bfs(self):
+        self.check_method("bfs")
+
+    def test_bidirectional(self):
+        self.check_method("bidirectional")
+
+    @unittest.skipUnless(HAVE_NUMPY, "needs numpy")
+    def test_numpy(self):
+        self.check_method("numpy")
+
+    def test_cached(self):
+        self.check_method("cached")
+
+    def test_astar(self):
+        self.check_method("astar")
+
+    def test_bounded(self):
+        self.check_method("bounded")
+
+    def test_symmetric(self):
+        self.check_method("symmetric")
+
+    def test_symmetric_with_shared_capacities(self):
+        # Three jugs of one size are where the symmetric search prunes states
+        rng = random.Random(1)
+        for _ in range(40):
+            capacity = rng.randint(2, 6)
+            capacities = (capacity,) * 3 + (rng.randint(1, 6),)
+            goal = tuple(rng.randint(0, c) for c in capacities)
+            start = (0,) * len(capacities)
+            with self.subTest(capacities=capacities, goal=goal):
+                solution = SEARCH_METHODS["symmetric"](capacities, start, goal)
+                if start != goal:
+                    self.check_solution(capacities, start, goal, solution, brute_force_distances(capacities, start))
+
+    def test_bounded_falls_back_to_ida(self):
+        from waterwise.bounded import MemoryBudget
+
+        rng = random.Random(2)
+        for capacities, start, goal in random_puzzles(rng, 100, max_jugs=2):
+            distances = brute_force_distances(capacities, start)
+            budget = MemoryBudget(0.003)  # room for 9 states
+            with self.subTest(capacities=capacities, start=start, goal=goal):
+                solution = SEARCH_METHODS["bounded"](capacities, start, goal, budget=budget)
+                if start == goal:
+                    self.assertEqual(solution, [])
+                elif goal in distances and distances[goal] > budget.max_states(len(capacities)):
+                    self.assertIsNone(solution)  # Longer than the IDA* move cap
+                else:
+                    self.check_solution(capacities, start, goal, solution, distances)
+
+    def test_start_out_of_range(self):
+        with self.assertRaises(ValueError):
+            solve((3, 5), {1: 4}, start=(4, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Round trips of the stored solution tables.
+"""
+
+import random
+import tempfile
+import unittest
+
+from tests.helpers import brute_force_distances, random_puzzles
+from waterwise.goals import AnyJugGoal
+from waterwise.reachability import DistanceMap
+from waterwise.store import load_map, save_map, stored_solve, table_path
+
+
+class StoredTableTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_save_and_load(self):
+        rng = random.Random(0)
+        for capacities, start, _ in random_puzzles(rng, 30):
+            with self.subTest(capacities=capacities, start=start):
+                reach = DistanceMap(capacities, start)
+                save_map(reach, self.directory.name)
+                loaded = load_map(capacities, start, self.directory.name)
+                self.assertIsNotNone(loaded)
+                self.assertEqual(loaded.start, reach.start)
+                self.assertEqual(list(loaded.parents), list(reach.parents))
+                self.assertEqual(list(loaded.order), list(reach.order))
+                self.assertEqual(loaded.level_starts, reach.level_starts)
+
+    def test_missing_and_mismatched_tables(self):
+        self.assertIsNone(load_map((3, 5), None, self.directory.name))
+        save_map(DistanceMap((3, 5)), self.directory.name)
+        with open(table_path((3, 5), None, self.directory.name), "r+b") as f:
+            f.write(b"XXXX")  # Wrong magic
+        self.assertIsNone(load_map((3, 5), None, self.directory.name))
+
+    def test_stored_solve_matches_brute_force(self):
+        rng = random.Random(1)
+        for capacities, start, goal in random_puzzles(rng, 60):
+            distances = brute_force_distances(capacities, start)
+            target = {i: level for i, level in enumerate(goal) if level}
+            with self.subTest(capacities=capacities, start=start, goal=goal):
+                first = stored_solve(capacities, target, start, directory=self.directory.name, populate=True)
+                second = stored_solve(capacities, target, start, directory=self.directory.name)
+                self.assertEqual(first, second)
+                if goal not in distances:
+                    self.assertIsNone(first)
+                else:
+                    self.assertEqual(len(first), distances[goal])
+                    self.assertEqual(first[-1][1] if first else start, goal)
+
+    def test_stored_goal(self):
+        save_map(DistanceMap((3, 5)), self.directory.name)
+        solution = stored_solve((3, 5), AnyJugGoal(4), directory=self.directory.name)
+        self.assertEqual(len(solution), 6)
+        self.assertIn(4, solution[-1][1])
+
+    def test_start_out_of_range(self):
+        with self.assertRaises(ValueError):
+            stored_solve((3, 5), {1: 4}, start=(0, 6), directory=self.directory.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
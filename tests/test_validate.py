@@ -0,0 +1,88 @@
+"""
+Cross-checks the NumPy validator against replaying codes one by one with
+recording.apply_code().
+"""
+
+import importlib.util
+import random
+import unittest
+
+from waterwise.recording import EMPTY, FILL, POUR, apply_code, check_code
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def random_code(rng, num_jugs):
+    """
+    Returns a random (op, src, dst) code, now and then a malformed one: an
+    unknown op, a jug outside the puzzle, or a fill or empty naming two jugs.
+    """
+    op = rng.choice((FILL, EMPTY, POUR, POUR, rng.randint(-1, 4)))
+    src = rng.randint(0, num_jugs - 1)
+    dst = src if op != POUR else rng.randint(0, num_jugs - 1)
+    if rng.random() < 0.1:
+        src = rng.randint(-2, num_jugs + 1)
+    if rng.random() < 0.1:
+        dst = rng.randint(-2, num_jugs + 1)
+    return op, src, dst
+
+
+def replay_codes(capacities, start, codes):
+    """
+    Returns (valid, final state, index of the first illegal code or -1) from
+    playing codes with apply_code().
+    """
+    state = start
+    for index, code in enumerate(codes):
+        try:
+            _, state = apply_code(state, code, capacities)
+        except ValueError:
+            return False, state, index
+    return True, state, -1
+
+
+class CheckCodeTests(unittest.TestCase):
+    def test_malformed_codes(self):
+        for code in [(3, 0, 0), (FILL, 0, 1), (EMPTY, 1, 0), (POUR, 2, 0), (POUR, 0, -1)]:
+            with self.subTest(code=code):
+                with self.assertRaises(ValueError):
+                    check_code(code, 2)
+                with self.assertRaises(ValueError):
+                    apply_code((1, 1), code, (3, 5))
+
+    def test_legal_codes(self):
+        self.assertEqual(apply_code((0, 0), (FILL, 1, 1), (3, 5)), (("fill", 1), (0, 5)))
+        self.assertEqual(apply_code((0, 5), (POUR, 1, 0), (3, 5)), (("pour", 1, 0, 3), (3, 2)))
+        self.assertEqual(apply_code((3, 2), (EMPTY, 0, 0), (3, 5)), (("empty", 0), (0, 2)))
+
+
+@unittest.skipUnless(HAVE_NUMPY, "needs numpy")
+class ValidatorTests(unittest.TestCase):
+    def test_matches_apply_code(self):
+        from waterwise.validate import validate_sequences
+
+        rng = random.Random(0)
+        for _ in range(20):
+            capacities = tuple(rng.randint(1, 9) for _ in range(rng.randint(1, 4)))
+            start = tuple(rng.randint(0, c) for c in capacities)
+            sequences = [[random_code(rng, len(capacities)) for _ in range(rng.randint(0, 12))] for _ in range(50)]
+            result = validate_sequences(capacities, sequences, start)
+            for index, codes in enumerate(sequences):
+                valid, final, first_illegal = replay_codes(capacities, start, codes)
+                with self.subTest(capacities=capacities, start=start, codes=codes):
+                    self.assertEqual(bool(result.valid[index]), valid)
+                    self.assertEqual(tuple(int(level) for level in result.final[index]), final)
+                    self.assertEqual(int(result.first_illegal[index]), first_illegal)
+
+    def test_solved(self):
+        from waterwise.validate import validate_sequences
+
+        sequences = [[(FILL, 1, 1), (POUR, 1, 0), (EMPTY, 0, 0), (POUR, 1, 0), (FILL, 1, 1), (POUR, 1, 0),
+                      (EMPTY, 0, 0)],
+                     [(FILL, 1, 1)]]
+        result = validate_sequences((3, 5), sequences, target={1: 4})
+        self.assertEqual(result.solved.tolist(), [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
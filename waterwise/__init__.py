@@ -0,0 +1,14 @@
+"""
+Water Jug Problem solver package shared by the WaterWise front ends.
+
+Importing the package never loads a GUI toolkit: tkinter is imported when the
+Tkinter app (waterwise.tkapp) starts, and Pygame only by the game module
+(waterwise.game), which opens its window in main(). The solver can therefore
+be used headless, from scripts, servers or worker processes.
+"""
+
+from waterwise.goals import AnyJugGoal, ExactGoal, PartialGoal, TotalGoal
+from waterwise.solver import SEARCH_METHODS, SearchCancelled, describe_move, jug_letter, solve
+
+__all__ = ["AnyJugGoal", "ExactGoal", "PartialGoal", "SEARCH_METHODS", "SearchCancelled", "TotalGoal",
+           "describe_move", "jug_letter", "solve"]
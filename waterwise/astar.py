@@ -0,0 +1,76 @@
+"""
+A* search for puzzles too large for a blind breadth-first search.
+
+Every move changes the level of at most two jugs, so a state with k jugs that
+differ from the goal needs at least ceil(k / 2) more moves. That heuristic
+never overestimates and drops by at most one per move, so the first time the
+goal is taken off the queue its path is optimal. Among states with the same
+estimated total, the one estimated closest to the goal is expanded first.
+"""
+
+from heapq import heappop, heappush
+
+from waterwise.solver import PROGRESS_INTERVAL, reconstruct_path, successors
+
+
+def mismatch_heuristic(state, goal):
+    """
+    Lower bound on the moves left: half the number of jugs not at their goal
+    level, rounded up.
+    """
+    mismatched = 0
+    for level, wanted in zip(state, goal):
+        if level != wanted:
+            mismatched += 1
+    return (mismatched + 1) // 2
+
+
+def astar_solve(capacities, start, goal, progress=None, interval=PROGRESS_INTERVAL, stats=None):
+    """
+    Finds the shortest sequence of moves from start to goal with A*.
+
+    States are kept in dictionaries rather than a table over the whole state
+    space, so memory only grows with the states actually reached and any
+    number of jugs can be used.
+
+    progress, if given, is called as progress(states found, depth of the
+    state being expanded) every interval expanded states; it may raise
+    solver.SearchCancelled. stats, if given, is a waterwise.stats.SearchStats
+    to fill in.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    """
+    parents = {start: (None, None)}  # state -> (previous state, move taken)
+    cost = {start: 0}  # state -> fewest moves found so far
+    estimate = mismatch_heuristic(start, goal)
+    queue = [(estimate, estimate, 0, start)]  # (moves + estimate, estimate, tie counter, state)
+    closed = set()  # states already expanded with their final cost
+    pushed = 1
+    expanded = 0
+
+    while queue:
+        if stats is not None:
+            stats.peak_queue = max(stats.peak_queue, len(queue))
+        _, _, _, state = heappop(queue)
+        if state in closed:
+            continue  # A cheaper copy of this state was expanded already
+        if state == goal:
+            return reconstruct_path(parents, state)
+        closed.add(state)
+        if stats is not None:
+            stats.expanded += 1
+
+        moves = cost[state] + 1
+        for move, new_state in successors(state, capacities):
+            if moves < cost.get(new_state, moves + 1):
+                cost[new_state] = moves
+                parents[new_state] = (state, move)
+                estimate = mismatch_heuristic(new_state, goal)
+                heappush(queue, (moves + estimate, estimate, pushed, new_state))
+                pushed += 1
+
+        expanded += 1
+        if progress is not None and expanded % interval == 0:
+            progress(len(cost), moves - 1)
+
+    return None
@@ -0,0 +1,192 @@
+"""
+Non-interactive batch solver.
+
+Reads puzzles from a JSON Lines or CSV file (or stdin), solves them in parallel
+in a process pool and writes one JSON line per puzzle as soon as it finishes.
+Input is read lazily and only a bounded number of puzzles is in flight at a
+time, so memory stays flat however large the input is.
+
+JSON Lines input, one puzzle per line:
+
+    {"capacities": [3, 5], "target": [0, 4]}
+    {"id": "p2", "capacities": [8, 5, 3], "target": {"0": 4, "1": 4}, "start": [8, 0, 0]}
+
+CSV input, with a header row and space-separated levels:
+
+    capacities,target,start
+    3 5,0 4,
+    8 5 3,4 4 0,8 0 0
+
+Usage:
+
+    python -m waterwise.batch puzzles.jsonl --workers 8
+    python WaterWise.py --batch puzzles.csv
+    waterwise-batch puzzles.jsonl        (once installed with pip install .)
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from waterwise.precheck import start_problem, unsolvable_reason
+from waterwise.solver import SEARCH_METHODS, iter_steps, solve
+
+
+def parse_levels(text):
+    """
+    Turns a space-separated CSV cell such as "3 5" into a list of integers.
+    """
+    return [int(value) for value in text.split()]
+
+
+def read_puzzles(stream, input_format):
+    """
+    Yields (line number, puzzle dictionary) pairs from a JSON Lines or CSV stream.
+    Lines that cannot be parsed are yielded as (line number, error message).
+    """
+    if input_format == "csv":
+        for line_number, row in enumerate(csv.DictReader(stream), 2):
+            try:
+                puzzle = {
+                    "capacities": parse_levels(row["capacities"]),
+                    "target": parse_levels(row["target"]),
+                }
+                if row.get("start", "").strip():
+                    puzzle["start"] = parse_levels(row["start"])
+                if row.get("id"):
+                    puzzle["id"] = row["id"]
+                yield line_number, puzzle
+            except (KeyError, ValueError, AttributeError) as e:
+                yield line_number, f"Invalid CSV row: {e}"
+    else:
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {e}"
+
+
+def solve_puzzle(line_number, puzzle, method):
+    """
+    Solves one puzzle and returns its result as a dictionary ready to be
+    written as a JSON line. Runs inside a worker process.
+    """
+    result = {"line": line_number}
+    if "id" in puzzle:
+        result["id"] = puzzle["id"]
+    try:
+        capacities = [int(c) for c in puzzle["capacities"]]
+        target = puzzle["target"]
+        if isinstance(target, dict):
+            target = {int(i): int(amount) for i, amount in target.items()}
+        else:
+            target = {i: int(amount) for i, amount in enumerate(target) if int(amount) > 0}
+        start = puzzle.get("start")
+        if start is not None:
+            start = [int(level) for level in start]
+            if len(start) != len(capacities):
+                raise ValueError("start must give one level per jug")
+            problem = start_problem(capacities, start)
+            if problem is not None:
+                raise ValueError(problem)
+        reason = unsolvable_reason(capacities, target, start)
+        solution = None if reason else solve(capacities, target, start=start, method=method)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        result["error"] = f"Invalid puzzle: {e}"
+        return result
+
+    result["solvable"] = solution is not None
+    if solution is None:
+        result["reason"] = reason or "No solution found for the given inputs."
+    else:
+        result["moves"] = len(solution)
+        result["steps"] = [{"action": action, "state": list(state)} for _, action, state in iter_steps(solution)]
+    return result
+
+
+def run_batch(stream, output, input_format="jsonl", workers=None, method="bfs"):
+    """
+    Solves every puzzle in the input stream with a pool of worker processes and
+    writes each result to output as soon as it is ready (so results may come
+    out of input order; the "line" field says which puzzle they belong to).
+    Returns (number of puzzles, seconds taken).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4  # keeps memory flat for inputs of any size
+    started = time.perf_counter()
+    count = 0
+
+    def write(result):
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    def collect(future):
+        """
+        Writes the result of a finished puzzle, or an error line if its worker
+        failed, so one bad puzzle never stops the rest of the batch.
+        """
+        line_number = lines.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"line": line_number, "error": f"Solver failed: {e}"}
+        write(result)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        lines = {}  # future -> input line of its puzzle
+        for line_number, puzzle in read_puzzles(stream, input_format):
+            count += 1
+            if isinstance(puzzle, str):
+                write({"line": line_number, "error": puzzle})
+                continue
+            future = executor.submit(solve_puzzle, line_number, puzzle, method)
+            lines[future] = line_number
+            pending.add(future)
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+        for future in wait(pending).done:
+            collect(future)
+
+    return count, time.perf_counter() - started
+
+
+def batch_main(path, input_format=None, workers=None, method="bfs"):
+    """
+    Runs a batch from a file name (or "-" for stdin) and reports throughput on stderr.
+    """
+    if input_format is None:
+        input_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if path == "-":
+        count, elapsed = run_batch(sys.stdin, sys.stdout, input_format, workers, method)
+    else:
+        with open(path, newline="") as stream:
+            count, elapsed = run_batch(stream, sys.stdout, input_format, workers, method)
+    rate = count / elapsed if elapsed else 0
+    print(f"Solved {count} puzzles in {elapsed:.2f}s ({rate:.1f} puzzles/s)", file=sys.stderr)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the batch solver.
+    """
+    parser = argparse.ArgumentParser(description="Solve many Water Jug puzzles in parallel")
+    parser.add_argument("input", nargs="?", default="-", help="JSON Lines or CSV file, or - for stdin (default)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None,
+                        help="input format (default: from the file extension, jsonl for stdin)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--method", choices=list(SEARCH_METHODS), default="bfs", help="search method (default: bfs)")
+    args = parser.parse_args(argv)
+    batch_main(args.input, args.format, args.workers, args.method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Memory-bounded search for state spaces too large to keep in memory.
+
+The search first runs A* (see waterwise.astar) while the states it stores fit
+in the memory budget. If the budget runs out, it starts again with IDA*:
+repeated depth-first searches with a growing limit on moves + heuristic, which
+only keep the current path plus a transposition table capped at the budget.
+IDA* revisits states many times, so it is slower, but its memory use stays
+fixed and its solution is still optimal. The MemoryBudget records whether this
+trade of time for memory happened.
+"""
+
+from waterwise.astar import astar_solve, mismatch_heuristic
+from waterwise.encoding import StateSpace
+from waterwise.solver import PROGRESS_INTERVAL, successors
+
+# Default memory budget, in megabytes
+DEFAULT_BUDGET_MB = 256
+
+# Rough cost of one stored state in the A* dictionaries and heap, on top of
+# 8 bytes per jug for the state tuple itself
+BYTES_PER_STATE = 320
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised inside the A* phase when it stores more states than the budget allows.
+    """
+
+
+class MemoryBudget:
+    def __init__(self, megabytes=DEFAULT_BUDGET_MB):
+        self.megabytes = megabytes  # memory the search may use for stored states
+        self.traded_time = False  # True once the search had to fall back to IDA*
+        self.states_stored = 0  # states held by the A* phase when it stopped
+        self.iterations = 0  # IDA* depth-first passes run
+
+    def max_states(self, num_jugs):
+        """
+        Returns how many states fit in the budget for puzzles with num_jugs jugs.
+        """
+        return max(1, int(self.megabytes * 2 ** 20) // (BYTES_PER_STATE + 8 * num_jugs))
+
+    def report(self):
+        """
+        Returns a message describing the time-for-memory trade, or None if the
+        search fitted in the budget.
+        """
+        if not self.traded_time:
+            return None
+        return (f"Memory budget of {self.megabytes} MB reached after {self.states_stored} states; "
+                f"switched to IDA*, which needed {self.iterations} passes.")
+
+
+def depth_limited_search(capacities, start, goal, limit, max_states, counter, progress):
+    """
+    One IDA* pass: depth-first search from start that skips every state whose
+    moves so far plus heuristic exceed limit. States on the current path are
+    never revisited, and up to max_states states remember the fewest moves
+    they were reached with so repeated visits at a higher cost are skipped.
+
+    counter is a one-item list holding the number of states visited so far;
+    progress is called every PROGRESS_INTERVAL visits.
+
+    Returns (path, next limit): path is a list of (move, state) pairs or None,
+    and next limit is the smallest cost that went over limit.
+    """
+    path = []  # (move, state) pairs from start to the state being expanded
+    on_path = {start}
+    best_moves = {start: 0}  # transposition table: state -> fewest moves seen in this pass
+    stack = [successors(start, capacities)]
+    next_limit = None
+
+    while stack:
+        step = next(stack[-1], None)
+        if step is None:
+            # Every move from this state was tried, so step back
+            stack.pop()
+            if path:
+                on_path.discard(path.pop()[1])
+            continue
+
+        move, state = step
+        if state in on_path:
+            continue
+        moves = len(path) + 1
+        cost = moves + mismatch_heuristic(state, goal)
+        if cost > limit:
+            if next_limit is None or cost < next_limit:
+                next_limit = cost
+            continue
+        if state == goal:
+            path.append(step)
+            return path, next_limit
+
+        best = best_moves.get(state)
+        if best is not None and best <= moves:
+            continue  # Already searched from here with at least as many moves to spare
+        if best is not None or len(best_moves) < max_states:
+            best_moves[state] = moves
+
+        path.append(step)
+        on_path.add(state)
+        stack.append(successors(state, capacities))
+
+        counter[0] += 1
+        if progress is not None and counter[0] % PROGRESS_INTERVAL == 0:
+            progress(counter[0], limit)
+
+    return None, next_limit
+
+
+def bounded_solve(capacities, start, goal, progress=None, stats=None, budget=None):
+    """
+    Finds the shortest sequence of moves from start to goal without storing
+    more states than the memory budget allows.
+
+    budget is a MemoryBudget (a default one is used if None); afterwards its
+    traded_time and report() tell whether the slower IDA* fallback was needed.
+
+    progress, if given, is called as progress(states found, depth) during A*
+    and progress(states visited, move limit) during IDA*; it may raise
+    solver.SearchCancelled. stats, if given, is a waterwise.stats.SearchStats
+    to fill in; IDA* visits count as expanded states and its queue is the
+    current path.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    IDA* only looks for paths of at most as many moves as the budget holds
+    states (and no more than the number of possible states, which no
+    shortest path can exceed), so it always ends: once the move limit passes
+    that cap it returns None. Reaching the cap on an unreachable goal can
+    still take long on large puzzles, which is why solve() rules out
+    impossible targets with waterwise.precheck first.
+    """
+    if budget is None:
+        budget = MemoryBudget()
+    if start == goal:
+        return []
+    max_states = budget.max_states(len(capacities))
+
+    def limited_progress(found, depth):
+        """
+        Stops the A* phase once it holds more states than the budget allows.
+        """
+        if found > max_states:
+            budget.states_stored = found
+            raise BudgetExceeded
+        if progress is not None:
+            progress(found, depth)
+
+    try:
+        # Check the budget often enough that A* cannot overshoot it by much
+        interval = max(1, min(PROGRESS_INTERVAL, max_states // 64))
+        return astar_solve(capacities, start, goal, limited_progress, interval, stats)
+    except BudgetExceeded:
+        pass
+
+    # Trade time for memory: deepen the move limit until a path fits under it
+    budget.traded_time = True
+    counter = [0]
+    visited = 0  # counter[0] at the end of the previous pass
+    limit = mismatch_heuristic(start, goal)
+    longest = min(max_states, StateSpace(capacities).size - 1)  # most moves a path may take
+    while limit is not None and limit <= longest:
+        budget.iterations += 1
+        path, limit = depth_limited_search(capacities, start, goal, limit, max_states, counter, progress)
+        if stats is not None:
+            stats.expanded += counter[0] - visited
+            stats.peak_queue = max(stats.peak_queue, limit or 0)  # the path never grows past the limit
+            visited = counter[0]
+        if path is not None:
+            return path
+    return None
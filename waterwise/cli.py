@@ -0,0 +1,242 @@
+import argparse
+import sys
+import time
+
+from waterwise.batch import batch_main
+from waterwise.bounded import MemoryBudget
+from waterwise.goals import AnyJugGoal, Goal, PartialGoal, TotalGoal
+from waterwise.precheck import unsolvable_reason
+from waterwise.output import json_lines, stats_lines, table_lines
+from waterwise.recording import Recording
+from waterwise.solver import SEARCH_METHODS, jug_letter
+from waterwise.stats import SearchStats
+from waterwise.store import stored_solve
+from waterwise.supply import OBJECTIVES, water_drawn
+
+
+def water_jug_problem(method="bfs", table_dir=None, save_table=False, json_output=False, memory_budget=None,
+                      objective="moves", show_stats=False, save_path=None, goal="exact"):
+    """
+    Main function that sets up and solves the Water Jug Problem.
+    It handles user input, problem setup, solution finding, and result display.
+    method selects the search used by the solver when no stored table exists.
+    table_dir is where solution tables are stored, and save_table builds and
+    saves the table for these jugs if it is missing. json_output prints the
+    steps as JSON lines instead of a table. memory_budget, in megabytes,
+    caps the memory of the search by using the "bounded" method. objective
+    "water" finds the solution that draws the least water instead of the one
+    with the fewest moves. show_stats prints what the search did: states
+    expanded, duplicates, peak queue length and the size and time of each level.
+    save_path, if given, is a file the solution is saved to as a compact
+    recording (JSON if it ends in .json, binary otherwise). goal selects what
+    the user is asked for: "exact" amounts for every jug, "partial" amounts
+    for some jugs, an amount in "any" jug, or a "total" across all jugs.
+    """
+    # Keep JSON output clean by sending everything but the steps (banner, prompts, reports) to stderr
+    report_file = sys.stderr if json_output else sys.stdout
+
+    def ask(prompt):
+        """
+        Reads one answer from the user, showing the prompt on report_file.
+        """
+        report_file.write(prompt)
+        report_file.flush()
+        return input()
+
+    print("Welcome to the Water Jug Problem Solver!", file=report_file)
+    print("\nRules:", file=report_file)
+    print("1. You can only manipulate one jug at a time.", file=report_file)
+    print("2. Jugs can only be completely filled, completely emptied, or have water transferred between them.",
+          file=report_file)
+    print("3. There are no measurement instruments available.", file=report_file)
+    print("4. Water can be transferred between jugs or poured onto the ground.", file=report_file)
+    print("5. By default, there's an unlimited water supply, but this can be changed.", file=report_file)
+
+    # Get user inputs
+    num_jugs = int(ask("\nEnter the number of jugs: "))
+    if num_jugs > 5 and method == "bfs":
+        print("Tip: --method astar is much faster for puzzles with more than 5 jugs.", file=report_file)
+
+    jugs = []
+    for i in range(num_jugs):
+        capacity = int(ask(f"Enter the capacity of jug {jug_letter(i)}: "))
+        jugs.append({"capacity": capacity, "current": 0})
+
+    target = {}
+    if goal == "any":
+        target = AnyJugGoal(int(ask("\nEnter the amount to measure in any one jug: ")))
+    elif goal == "total":
+        target = TotalGoal(int(ask("\nEnter the total amount the jugs should hold together: ")))
+    else:
+        print("\nNow, enter the target amounts for each jug:", file=report_file)
+        for i in range(num_jugs):
+            if goal == "partial":
+                # Jugs left empty here may hold anything at the end
+                amount_text = ask(f"Enter the target amount for jug {jug_letter(i)} (leave empty for any amount): ")
+                if amount_text.strip():
+                    target[i] = int(amount_text)
+            else:
+                amount = int(ask(f"Enter the target amount for jug {jug_letter(i)} (0 if no target): "))
+                if amount > 0:
+                    target[i] = amount
+        if goal == "partial":
+            target = PartialGoal(target)
+
+    # Ask for the water supply; leaving it empty keeps it unlimited
+    supply_text = ask("\nEnter the water supply in litres (leave empty for unlimited): ").strip()
+    water_supply = int(supply_text) if supply_text else None
+
+    # Initialize steps
+    steps = []
+
+    def pour(from_jug, to_jug):
+        """
+        Transfers water from one jug to another.
+        Returns the amount of water transferred.
+        """
+        # Calculate the amount that can be transferred
+        amount = min(jugs[from_jug]["current"], jugs[to_jug]["capacity"] - jugs[to_jug]["current"])
+        jugs[from_jug]["current"] -= amount  # Decrease water in source jug
+        jugs[to_jug]["current"] += amount    # Increase water in destination jug
+        return amount
+
+    def is_goal_reached():
+        """
+        Checks if the current state of jugs matches the target state.
+        Returns True if the goal is reached, False otherwise.
+        """
+        if isinstance(target, Goal):
+            return target.matches(get_jug_state())
+        # Check if all jugs match their target amounts (or 0 if no target)
+        return all(jugs[i]["current"] == target.get(i, 0) for i in range(num_jugs))
+
+    def get_jug_state():
+        """
+        Returns the current state of all jugs as a tuple.
+        """
+        # Create a tuple of current water amounts in all jugs
+        return tuple(jug["current"] for jug in jugs)
+
+    # Rule out impossible targets instantly, then search for the shortest solution
+    capacities = [jug["capacity"] for jug in jugs]
+    budget = None
+    if memory_budget is not None:
+        method = "bounded"
+        budget = MemoryBudget(memory_budget)
+    stats = SearchStats() if show_stats else None
+    started = time.perf_counter()
+    reason = unsolvable_reason(capacities, target, supply=water_supply)
+    solution = None if reason else stored_solve(capacities, target, method=method,
+                                                directory=table_dir, populate=save_table, budget=budget,
+                                                supply=water_supply, objective=objective, stats=stats)
+    elapsed = time.perf_counter() - started
+
+    if budget is not None and budget.report():
+        print(f"\n{budget.report()}", file=report_file)
+    if stats is not None:
+        for line in stats_lines(stats, elapsed):
+            print(line, file=report_file)
+
+    if solution is not None:
+        if not solution:
+            # An empty solution is still a solution: the jugs already meet the target
+            print("\nThe jugs already meet the target, so no moves are needed.", file=report_file)
+        else:
+            # Stream the solution one line at a time, as a table or as JSON lines
+            lines = json_lines(solution) if json_output else table_lines(solution, num_jugs)
+            for line in lines:
+                print(line)
+        if not json_output:
+            print(f"Water drawn from the supply: {water_drawn(get_jug_state(), solution)}L")
+        if save_path:
+            Recording.from_solution(capacities, target, get_jug_state(), solution).save(save_path)
+            print(f"Solution saved to {save_path}", file=report_file)
+    else:
+        print("\nNo solution found for the given inputs.", file=report_file)
+        if reason:
+            print(reason, file=report_file)
+
+
+def main(argv=None):
+    """
+    Command line entry point: reads the options and runs the solver, or the
+    batch solver with --batch. Used by WaterWise.py and the waterwise command.
+    """
+    parser = argparse.ArgumentParser(description="Water Jug Problem Solver")
+    parser.add_argument("--method", choices=list(SEARCH_METHODS), default="bfs",
+                        help="search used to find the solution (default: bfs)")
+    parser.add_argument("--table-dir", default=None,
+                        help="directory of stored solution tables (default: $WATERWISE_TABLES or ~/.cache/waterwise)")
+    parser.add_argument("--save-table", action="store_true",
+                        help="build and store the solution table for these jugs if it is missing")
+    parser.add_argument("--batch", metavar="FILE", default=None,
+                        help="solve every puzzle in a JSON Lines or CSV file (- for stdin) instead of asking")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes for --batch (default: CPU count)")
+    parser.add_argument("--memory-budget", type=float, metavar="MB", default=None,
+                        help="cap the search's memory, falling back to a slower IDA* search if needed")
+    parser.add_argument("--goal", choices=["exact", "partial", "any", "total"], default="exact",
+                        help="what to reach: exact amounts in every jug, amounts in some jugs (partial), "
+                             "an amount in any one jug, or a total across all jugs (default: exact)")
+    parser.add_argument("--objective", choices=list(OBJECTIVES), default="moves",
+                        help="find the solution with the fewest moves or the one drawing the least water")
+    parser.add_argument("--stats", action="store_true",
+                        help="print search statistics: states expanded, duplicates, peak queue, per-depth sizes and times")
+    parser.add_argument("--save", metavar="FILE", default=None,
+                        help="save the solution as a compact recording (JSON if FILE ends in .json); "
+                             "replay it with python -m waterwise.recording FILE")
+    parser.add_argument("--json", action="store_true",
+                        help="print the solution as one JSON object per step instead of a table")
+    args = parser.parse_args(argv)
+
+    # Run the water jug problem solver
+    if args.batch:
+        batch_main(args.batch, workers=args.workers, method=args.method)
+    else:
+        water_jug_problem(method=args.method, table_dir=args.table_dir, save_table=args.save_table,
+                          json_output=args.json, memory_budget=args.memory_budget,
+                          objective=args.objective, show_stats=args.stats, save_path=args.save,
+                          goal=args.goal)
+
+
+# The guard keeps worker processes started by --batch from running the
+# interactive solver again
+if __name__ == "__main__":
+    main()
+
+# Execution flow of the code:
+# 1. main() reads the command line options. With --batch, puzzles are read from a file and solved in
+#    parallel by waterwise.batch; otherwise the water_jug_problem() function is called.
+# 2. It displays the welcome message and rules of the game.
+# 3. User inputs are collected for the number of jugs, their capacities, target amounts and
+#    the water supply.
+# 4. unsolvable_reason() rules out impossible targets, then stored_solve() answers from a
+#    stored solution table if there is one, or finds the solution using BFS.
+# 5. If a solution is found, it's streamed step by step as a table (or as JSON lines with --json).
+# 6. If no solution is found, an appropriate message is displayed.
+#
+# Features:
+# - Supports any number of jugs; --method astar handles large puzzles with an A* search
+# - Allows setting individual capacities for each jug
+# - Allows setting target amounts for each jug, or with --goal: amounts for only some jugs
+#   (partial), an amount in any one jug (any) or a total across all jugs (total); the search
+#   stops at the nearest state that meets the goal
+# - Uses BFS to find the optimal solution, or a bidirectional search with --method bidirectional
+# - Treats three or more jugs with the same capacity and target as interchangeable, so each
+#   arrangement of their levels is searched only once (--method symmetric does this for any group)
+# - Respects a finite water supply, and finds the solution drawing the least water with
+#   --objective water
+# - Keeps the search within a memory budget with --memory-budget, reporting when it had to
+#   switch to a slower search to stay within it
+# - Saves the solution with --save as a compact recording of (op, src, dst) move codes, in
+#   binary or as JSON, which python -m waterwise.recording replays
+# - Prints search statistics with --stats (states expanded and generated, duplicates, peak
+#   queue length, and the frontier size and time of every BFS level)
+# - Reuses solution tables stored on disk (--save-table stores them) instead of searching
+# - Solves files of puzzles in parallel with --batch, printing one JSON line per puzzle
+# - Handles various jug operations: filling, emptying, and transferring between jugs
+# - Provides a clear, step-by-step solution output
+# - Includes error handling for invalid inputs
+# - Has an (currently unused) pour() function for potential future use in manual solving
+# - Includes an is_goal_reached() function to check if the target state is achieved
+# - Uses get_jug_state() to easily obtain the current state of all jugs
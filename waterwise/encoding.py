@@ -0,0 +1,126 @@
+"""
+Packed integer encoding of jug states.
+
+Every jug level lies between 0 and its capacity, so a state is a mixed-radix
+number with one digit per jug (jug A is the least significant digit). The
+whole state space then maps onto the integers 0 .. product(capacity + 1) - 1,
+which lets the solver keep its bookkeeping in flat arrays indexed by state
+instead of hashing tuples into sets and dictionaries.
+"""
+
+from array import array
+
+# State spaces with more slots than this use a dictionary instead of a flat array
+DENSE_TABLE_LIMIT = 2 ** 27
+
+
+class SparseTable(dict):
+    """
+    Dictionary stand-in for the flat state table, used when the state space is
+    too large to preallocate. Missing states read as unvisited, like the
+    untouched slots of the flat array.
+    """
+    typecode = "Q"  # array type used for lists of state codes
+
+    def __init__(self, unvisited):
+        super().__init__()
+        self.unvisited = unvisited
+
+    def __missing__(self, code):
+        return self.unvisited
+
+
+class StateSpace:
+    def __init__(self, capacities):
+        self.capacities = tuple(capacities)  # maximum level of each jug
+        self.radices = tuple(c + 1 for c in self.capacities)  # number of possible levels per jug
+        self.weights = []  # value of one litre in each jug's digit
+        size = 1
+        for radix in self.radices:
+            self.weights.append(size)
+            size *= radix
+        self.weights = tuple(self.weights)
+        self.size = size  # number of possible states
+
+    def encode(self, state):
+        """
+        Packs a tuple of jug levels into a single integer.
+        """
+        return sum(level * weight for level, weight in zip(state, self.weights))
+
+    def decode(self, code):
+        """
+        Unpacks an integer back into a tuple of jug levels.
+        """
+        levels = []
+        for radix in self.radices:
+            code, level = divmod(code, radix)
+            levels.append(level)
+        return tuple(levels)
+
+    def new_table(self):
+        """
+        Returns a preallocated array with one slot per state, every slot set to
+        self.size (never a valid state) to mark it as not visited yet.
+        Slots are 4 bytes wide unless the state space needs more. State spaces
+        above DENSE_TABLE_LIMIT get a SparseTable that behaves the same way.
+        """
+        if self.size > DENSE_TABLE_LIMIT:
+            return SparseTable(self.size)
+        typecode = "I" if self.size < 2 ** 32 else "Q"
+        return array(typecode, [self.size]) * self.size
+
+    def successor_codes(self, code):
+        """
+        Yields the encoded state reached by every legal move from the given
+        state, in the same order as solver.successors().
+        """
+        capacities = self.capacities
+        weights = self.weights
+        levels = self.decode(code)
+        num_jugs = len(capacities)
+        for i in range(num_jugs):
+            current = levels[i]
+
+            # Fill jug
+            if current < capacities[i]:
+                yield code + (capacities[i] - current) * weights[i]
+
+            # Empty jug
+            if current > 0:
+                yield code - current * weights[i]
+
+                # Pour to another jug
+                for j in range(num_jugs):
+                    if i != j and levels[j] < capacities[j]:
+                        amount = min(current, capacities[j] - levels[j])
+                        yield code + amount * (weights[j] - weights[i])
+
+    def predecessor_codes(self, code):
+        """
+        Yields the encoded state of everything that reaches the given state in
+        one move, in the same order as solver.predecessors().
+        """
+        capacities = self.capacities
+        weights = self.weights
+        levels = self.decode(code)
+        num_jugs = len(capacities)
+        for i in range(num_jugs):
+            current = levels[i]
+            weight = weights[i]
+
+            # Fill jug: the jug is full now and held anything less before
+            if current == capacities[i]:
+                for amount in range(capacities[i], 0, -1):
+                    yield code - amount * weight
+
+            # Empty jug: the jug is empty now and held some water before
+            if current == 0:
+                for amount in range(1, capacities[i] + 1):
+                    yield code + amount * weight
+
+            # Pour from jug i to jug j: either the source ran dry or the destination filled up
+            for j in range(num_jugs):
+                if i != j and (current == 0 or levels[j] == capacities[j]):
+                    for amount in range(1, min(capacities[i] - current, levels[j]) + 1):
+                        yield code + amount * (weight - weights[j])
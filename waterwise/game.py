@@ -0,0 +1,775 @@
+import sys
+import random
+import threading
+import time
+from functools import lru_cache
+
+from waterwise.generate import random_puzzle
+from waterwise.precheck import unsolvable_reason
+from waterwise.reachability import GoalMap
+from waterwise.recording import EMPTY, FILL, POUR, Recording, replay
+from waterwise.solver import SearchCancelled, describe_move, goal_state, jug_letter
+from waterwise.store import stored_solve
+
+# Display size; the window itself is only opened by init_display()
+WIDTH, HEIGHT = 1024, 768
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BLUE = (0, 0, 255)
+LIGHT_BLUE = (173, 216, 230)
+GREEN = (0, 255, 0)
+GRAY = (200, 200, 200)
+RED = (255, 0, 0)
+
+# Pygame module, display surface and fonts, set up by init_display() when the game starts
+pygame = None
+screen = None
+font = None
+small_font = None
+
+# Background solver
+SOLVED_EVENT = None  # posted by the solver thread when it finishes; set by init_display()
+SOLVE_TIME_LIMIT = 30  # seconds before the solver gives up
+SOLVE_STATE_LIMIT = 5_000_000  # states explored before the solver gives up
+HINT_EVENT = None  # posted by the hint thread when the distance map is ready; set by init_display()
+MAX_JUGS = 5  # jugs (and their rows of buttons) that fit across the screen
+SESSION_FILE = "waterwise-session.wwr"  # where the Save button writes the player's moves
+SOLUTION_FILE = "waterwise-solution.wwr"  # where the Save button writes the solver's solution
+RANDOM_FILL_MOVES = (4, 10)  # range of optimal solution lengths for Random Fill puzzles
+RANDOM_FILL_STATES = 40_000  # most states Random Fill sweeps, so picking a puzzle stays instant
+
+def init_display():
+    """
+    Function to import and initialize Pygame, open the game window and load
+    the fonts. Pygame is not imported with this module, so the package can be
+    imported headless and the window only appears once the game is launched.
+    """
+    global pygame, screen, font, small_font, SOLVED_EVENT, HINT_EVENT
+    import pygame
+    SOLVED_EVENT = pygame.USEREVENT + 1
+    HINT_EVENT = pygame.USEREVENT + 2
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Water Jug Problem Solver Game")
+    font = pygame.font.Font(None, 32)
+    small_font = pygame.font.Font(None, 24)
+
+@lru_cache(maxsize=512)
+def render_text(text, text_font, color):
+    """
+    Renders a string once and returns the same surface every time it is drawn
+    again, so unchanged labels are never re-rendered.
+    """
+    return text_font.render(text, True, color)
+
+# Jug class to represent a water jug
+class Jug:
+    def __init__(self, x, y, capacity, current=0):
+        self.x = x  # x-coordinate of the jug
+        self.y = y  # y-coordinate of the jug
+        self.capacity = capacity  # maximum capacity of the jug
+        self.current = current  # current amount of water in the jug
+        self.width = 60  # width of the jug's visual representation
+        self.height = 120  # height of the jug's visual representation
+        self.rect = pygame.Rect(x, y, 150, self.height + 40)  # area covered by the jug and its label
+
+    @property
+    def current(self):
+        return self._current
+
+    @current.setter
+    def current(self, value):
+        self._current = value
+        self.dirty = True  # the jug has to be redrawn
+
+    def draw(self, screen):
+        """
+        Draws the jug on the screen and returns the rectangle it covers.
+        """
+        screen.fill(WHITE, self.rect)  # Clear the previous water level and label
+        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)  # Draw the jug outline
+        water_height = int(self.height * (self.current / self.capacity))  # Calculate the height of the water level
+        pygame.draw.rect(screen, LIGHT_BLUE, (self.x, self.y + self.height - water_height, self.width, water_height))  # Draw the water level
+        text = render_text(f"{self.current}/{self.capacity}", font, BLACK)  # Current/capacity text, rendered once per value
+        screen.blit(text, (self.x, self.y + self.height + 10))  # Display the current/capacity text
+        self.dirty = False
+        return self.rect
+
+# Button class to represent a clickable button
+class Button:
+    def __init__(self, x, y, width, height, text, action):
+        self.rect = pygame.Rect(x, y, width, height)  # Rectangle representing the button
+        self.text = text  # Text displayed on the button
+        self.action = action  # Function to be called when the button is clicked
+        self.color = GRAY  # Default color of the button
+
+    def draw(self, screen):
+        """
+        Draws the button on the screen.
+        """
+        pygame.draw.rect(screen, self.color, self.rect)  # Draw the button rectangle
+        pygame.draw.rect(screen, BLACK, self.rect, 2)  # Draw the button outline
+        text = render_text(self.text, small_font, BLACK)  # Button text, rendered once
+        text_rect = text.get_rect(center=self.rect.center)  # Center the text on the button
+        screen.blit(text, text_rect)  # Display the button text
+
+    def handle_event(self, event):
+        """
+        Handles mouse events for the button.
+        Returns True if the button is clicked, False otherwise.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(event.pos):
+                self.action()  # Call the button's action function
+                return True
+        return False
+
+# InputBox class to represent a text input box
+class InputBox:
+    def __init__(self, x, y, w, h, text=''):
+        self.rect = pygame.Rect(x, y, w, h)  # Rectangle representing the input box
+        self.color = BLACK  # Default color of the input box
+        self.text = text  # Text inside the input box
+        self.txt_surface = font.render(text, True, self.color)  # Rendered text surface
+        self.active = False  # Flag indicating if the input box is active
+
+    def handle_event(self, event):
+        """
+        Handles events for the input box.
+        Returns the input text if the user presses Enter, None otherwise.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.rect.collidepoint(event.pos):
+                self.active = not self.active  # Toggle the active state
+            else:
+                self.active = False  # Deactivate the input box
+            self.color = BLUE if self.active else BLACK  # Change the color based on the active state
+        if event.type == pygame.KEYDOWN:
+            if self.active:
+                if event.key == pygame.K_RETURN:
+                    return self.text  # Return the input text if Enter is pressed
+                elif event.key == pygame.K_BACKSPACE:
+                    self.text = self.text[:-1]  # Remove the last character if Backspace is pressed
+                else:
+                    self.text += event.unicode  # Add the typed character to the input text
+                self.txt_surface = font.render(self.text, True, self.color)  # Re-render the text surface
+        return None
+
+    def draw(self, screen):
+        """
+        Draws the input box on the screen.
+        """
+        screen.blit(self.txt_surface, (self.rect.x+5, self.rect.y+5))  # Display the input text
+        pygame.draw.rect(screen, self.color, self.rect, 2)  # Draw the input box outline
+
+# TextLine class to represent a line of text that changes from time to time
+class TextLine:
+    def __init__(self, x, y, text_font):
+        self.x = x  # x-coordinate of the text
+        self.y = y  # y-coordinate of the text
+        self.font = text_font  # font used to render the text
+        self.text = ""  # text currently shown
+        self.color = BLACK  # colour of the text
+        self.rect = pygame.Rect(x, y, 0, 0)  # area covered the last time the line was drawn
+        self.dirty = True  # True if the line has to be redrawn
+
+    def set(self, text, color=BLACK):
+        """
+        Changes the text; the line is only marked for redrawing if it differs.
+        """
+        if text != self.text or color != self.color:
+            self.text = text
+            self.color = color
+            self.dirty = True
+
+    def draw(self, screen):
+        """
+        Redraws the line and returns the rectangle that changed on screen.
+        """
+        old_rect = self.rect
+        screen.fill(WHITE, old_rect)  # Clear the previous text
+        if self.text:
+            surface = render_text(self.text, self.font, self.color)
+            self.rect = screen.blit(surface, (self.x, self.y))
+        else:
+            self.rect = pygame.Rect(self.x, self.y, 0, 0)
+        self.dirty = False
+        return old_rect.union(self.rect)
+
+# ScrollList class to represent a scrollable list that only renders the rows in view
+class ScrollList:
+    def __init__(self, x, y, width, height, count, row_text, row_height=30):
+        self.rect = pygame.Rect(x, y, width, height)  # area of the list on screen
+        self.count = count  # number of rows in the list
+        self.row_text = row_text  # function returning the text of row i
+        self.row_height = row_height  # height of one row in pixels
+        self.visible_rows = height // row_height  # number of rows that fit in the list
+        self.first = 0  # index of the first row in view
+        self.surfaces = {}  # row index -> rendered row, kept only for the rows in view
+        self.dirty = True  # True if the list has to be redrawn
+
+    def scroll(self, rows):
+        """
+        Scrolls the list by the given number of rows (negative scrolls up).
+        """
+        first = max(0, min(self.first + rows, self.count - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self.dirty = True
+
+    def handle_event(self, event):
+        """
+        Scrolls the list with the mouse wheel, the arrow keys, Page Up/Down, Home and End.
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll(-event.y * 3)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_DOWN:
+                self.scroll(1)
+            elif event.key == pygame.K_UP:
+                self.scroll(-1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll(self.visible_rows)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll(-self.visible_rows)
+            elif event.key == pygame.K_HOME:
+                self.scroll(-self.count)
+            elif event.key == pygame.K_END:
+                self.scroll(self.count)
+
+    def draw(self, screen):
+        """
+        Draws the rows in view and returns the rectangle of the list.
+        Only visible rows are rendered, and a row stays cached while it is in
+        view, so the cost does not depend on the length of the list.
+        """
+        screen.fill(WHITE, self.rect)
+        screen.set_clip(self.rect)  # Keep long rows inside the list
+        visible = {}
+        for i in range(self.first, min(self.first + self.visible_rows, self.count)):
+            surface = self.surfaces.get(i)
+            if surface is None:
+                surface = small_font.render(self.row_text(i), True, BLACK)
+            visible[i] = surface
+            screen.blit(surface, (self.rect.x, self.rect.y + (i - self.first) * self.row_height))
+        self.surfaces = visible  # Forget rows that scrolled out of view
+
+        # Scroll bar, only when the list does not fit
+        if self.count > self.visible_rows:
+            bar_height = max(20, self.rect.height * self.visible_rows // self.count)
+            bar_y = self.rect.y + (self.rect.height - bar_height) * self.first // (self.count - self.visible_rows)
+            pygame.draw.rect(screen, GRAY, (self.rect.right - 8, bar_y, 8, bar_height))
+        screen.set_clip(None)
+        self.dirty = False
+        return self.rect
+
+def water_jug_game():
+    """
+    Main function that runs the Water Jug Problem Solver Game.
+    """
+    def get_user_input():
+        """
+        Function to get user input for the number of jugs, their capacities, and target amounts.
+        Returns a tuple containing the list of jugs and the target dictionary.
+        """
+        num_jugs = 0
+        jugs = []
+        target = {}
+        input_boxes = []
+        
+        num_jugs_box = InputBox(300, 100, 140, 32)  # Input box for the number of jugs
+        random_fill_button = Button(500, 100, 150, 50, "Random Fill", lambda: random_fill())  # Button to randomly fill the jugs and targets
+        next_button = Button(700, 100, 150, 50, "Next", lambda: next_page())  # Button to proceed to the game
+        
+        def random_fill():
+            """
+            Function to randomly fill the jugs and targets with a puzzle that is always solvable.
+            """
+            nonlocal num_jugs, jugs, target, input_boxes
+            num_jugs = random.randint(2, MAX_JUGS)  # Randomly choose the number of jugs between 2 and MAX_JUGS
+            num_jugs_box.text = str(num_jugs)
+            num_jugs_box.txt_surface = font.render(num_jugs_box.text, True, num_jugs_box.color)
+            
+            # Pick capacities and a target reachable in RANDOM_FILL_MOVES moves; more jugs get smaller
+            # capacities so the sweep over every state stays small
+            max_capacity = max(7, min(20, int(RANDOM_FILL_STATES ** (1 / num_jugs)) - 1))
+            capacities, target, _ = random_puzzle(num_jugs, 5, max_capacity, *RANDOM_FILL_MOVES)
+            jugs = [Jug(100 + i*200, 300, capacities[i]) for i in range(num_jugs)]  # Create jugs with the chosen capacities
+            
+            input_boxes = [InputBox(100 + i*200, 200, 140, 32, str(jugs[i].capacity)) for i in range(num_jugs)]  # Input boxes for jug capacities
+            input_boxes.extend([InputBox(100 + i*200, 250, 140, 32, str(target.get(i, 0))) for i in range(num_jugs)])  # Input boxes for target amounts
+        
+        def next_page():
+            """
+            Function to validate the user input and proceed to the game.
+            Returns a tuple containing the list of jugs and the target dictionary if the input is valid, None otherwise.
+            """
+            nonlocal num_jugs, jugs, target
+            try:
+                num_jugs = int(num_jugs_box.text)
+                if not (2 <= num_jugs <= MAX_JUGS):
+                    raise ValueError(f"Number of jugs must be between 2 and {MAX_JUGS}")
+                
+                jugs = [Jug(100 + i*200, 300, int(input_boxes[i].text)) for i in range(num_jugs)]  # Create jugs with user-specified capacities
+                target = {i: int(input_boxes[i+num_jugs].text) for i in range(num_jugs)}  # Set target amounts from user input
+                
+                if any(target[i] > jugs[i].capacity for i in range(num_jugs)):
+                    raise ValueError("Target amount cannot exceed jug capacity")
+                
+                return jugs, target
+            except ValueError as e:
+                print(f"Error: {str(e)}")
+                return None
+        
+        while True:
+            # Nothing on this page changes by itself, so sleep until there is input
+            for event in [pygame.event.wait()] + pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                
+                num_jugs_box.handle_event(event)
+                
+                for box in input_boxes:
+                    box.handle_event(event)
+                
+                if random_fill_button.handle_event(event):
+                    random_fill()
+                
+                if next_button.handle_event(event):
+                    result = next_page()
+                    if result:
+                        return result
+            
+            screen.fill(WHITE)
+            
+            text = render_text(f"Enter the number of jugs (2-{MAX_JUGS}):", font, BLACK)
+            screen.blit(text, (100, 100))
+            num_jugs_box.draw(screen)
+            
+            for i in range(len(input_boxes)):
+                if i < num_jugs:
+                    text = render_text(f"Jug {jug_letter(i)} Capacity:", font, BLACK)
+                    screen.blit(text, (100 + i*200, 180))
+                else:
+                    text = render_text(f"Jug {jug_letter(i-num_jugs)} Target:", font, BLACK)
+                    screen.blit(text, (100 + (i-num_jugs)*200, 230))
+                input_boxes[i].draw(screen)
+            
+            random_fill_button.draw(screen)
+            next_button.draw(screen)
+            
+            pygame.display.flip()
+
+    jugs, target = get_user_input()  # Get the list of jugs and target dictionary from the user
+
+    moves = 0  # Number of moves made by the user
+    solution = None  # Solution path found by the solver
+    solution_start = None  # Jug levels the solution starts from
+    session_start = tuple(jug.current for jug in jugs)  # Jug levels before the user's first move
+    user_steps = []  # (op, src, dst) code of every move made by the user; text is made when shown
+    solver_message = ""  # Shown when the solver could not find a solution
+    solver_thread = None  # Background thread running the solver, None when idle
+    cancel_solve = threading.Event()  # Set to ask the solver thread to stop
+    solve_progress = [0, 0]  # States explored and current depth, updated by the solver thread
+    hint_map = None  # Moves left to the target from every state, built once per puzzle
+    hint_thread = None  # Background thread building hint_map, None when idle
+    hint_progress = [0]  # States mapped so far, updated by the hint thread
+    hint_shown = False  # True while hints are switched on
+
+    def fill_jug(i):
+        """
+        Function to fill a jug with water.
+        """
+        nonlocal moves
+        if jugs[i].current < jugs[i].capacity:
+            jugs[i].current = jugs[i].capacity  # Fill the jug to its capacity
+            moves += 1  # Increment the move count
+            user_steps.append((FILL, i, i))  # Add the step to the user's steps list
+
+    def empty_jug(i):
+        """
+        Function to empty a jug of water.
+        """
+        nonlocal moves
+        if jugs[i].current > 0:
+            jugs[i].current = 0  # Empty the jug
+            moves += 1  # Increment the move count
+            user_steps.append((EMPTY, i, i))  # Add the step to the user's steps list
+
+    def pour(i, j):
+        """
+        Function to pour water from one jug to another.
+        """
+        nonlocal moves
+        amount = min(jugs[i].current, jugs[j].capacity - jugs[j].current)  # Calculate the amount of water that can be poured
+        if amount > 0:
+            jugs[i].current -= amount  # Decrease the water in the source jug
+            jugs[j].current += amount  # Increase the water in the destination jug
+            moves += 1  # Increment the move count
+            user_steps.append((POUR, i, j))  # Add the step to the user's steps list
+
+    def check_win():
+        """
+        Function to check if the current state of jugs matches the target state.
+        Returns True if the goal is reached, False otherwise.
+        """
+        return all(jugs[i].current == target.get(i, 0) for i in range(len(jugs)))
+
+    def get_jug_state():
+        """
+        Function to get the current state of all jugs as a tuple.
+        """
+        return tuple(jug.current for jug in jugs)
+
+    def solve_worker(capacities, start):
+        """
+        Runs the solver in a background thread and posts SOLVED_EVENT with the
+        solution (or None) and a message when it is done.
+        """
+        started = time.monotonic()
+
+        def report(explored, depth):
+            """
+            Progress callback: records progress for the main loop and stops the
+            search when it is cancelled or over its time/state budget.
+            """
+            solve_progress[0] = explored
+            solve_progress[1] = depth
+            if cancel_solve.is_set():
+                raise SearchCancelled("Solving cancelled.")
+            if explored > SOLVE_STATE_LIMIT:
+                raise SearchCancelled(f"Gave up after exploring {SOLVE_STATE_LIMIT} states.")
+            if time.monotonic() - started > SOLVE_TIME_LIMIT:
+                raise SearchCancelled(f"Gave up after {SOLVE_TIME_LIMIT} seconds.")
+
+        try:
+            # Use a stored table for these jugs if there is one, otherwise search from the current jug levels
+            result = stored_solve(capacities, target, start=start, progress=report)
+            message = "" if result is not None else "No solution found for the given inputs."
+        except SearchCancelled as e:
+            result = None
+            message = str(e)
+        except Exception as e:
+            # Still report back, otherwise the game would wait for this thread forever
+            result = None
+            message = f"The solver failed: {e}"
+        pygame.event.post(pygame.event.Event(SOLVED_EVENT, solution=result, start=start, message=message))
+
+    def solve_problem():
+        """
+        Function to solve the Water Jug Problem using the BFS algorithm.
+        The search runs in a background thread so the game keeps responding.
+        """
+        nonlocal solver_thread, solver_message
+        if solver_thread is not None:
+            return  # Already solving
+        capacities = [jug.capacity for jug in jugs]
+        # Rule out impossible targets instantly before searching
+        reason = unsolvable_reason(capacities, target, start=get_jug_state())
+        if reason:
+            solver_message = reason
+            return
+        solver_message = ""
+        cancel_solve.clear()
+        solve_progress[0] = solve_progress[1] = 0
+        solver_thread = threading.Thread(target=solve_worker, args=(capacities, get_jug_state()), daemon=True)
+        solver_thread.start()
+
+    def cancel_solving():
+        """
+        Function to ask the background solver to stop.
+        """
+        cancel_solve.set()
+
+    def save_recording():
+        """
+        Function to save the solution being shown, or the user's moves once
+        they have won, as a compact recording (see waterwise.recording).
+        """
+        capacities = [jug.capacity for jug in jugs]
+        if game_state == "solution":
+            recording = Recording.from_solution(capacities, target, solution_start, solution)
+            path = SOLUTION_FILE
+        else:
+            recording = Recording(capacities, session_start, goal_state(len(jugs), target), user_steps, "session")
+            path = SESSION_FILE
+        try:
+            recording.save(path)
+            saved_line.set(f"Saved to {path}")
+        except OSError as e:
+            saved_line.set(f"Could not save: {e.strerror}")
+
+    def hint_worker(capacities, goal):
+        """
+        Builds the distance-to-target map in a background thread and posts
+        HINT_EVENT with it when it is done.
+        """
+        def report(found, depth):
+            """
+            Progress callback: records how many states are mapped so far.
+            """
+            hint_progress[0] = found
+
+        pygame.event.post(pygame.event.Event(HINT_EVENT, hint_map=GoalMap(capacities, goal, progress=report)))
+
+    def toggle_hint():
+        """
+        Function to switch hints on or off. The first time, it starts building
+        the map of moves left from every state (a backward search from the
+        target); after that every hint is a single lookup.
+        """
+        nonlocal hint_shown, hint_thread
+        hint_shown = not hint_shown
+        hint_button.text = "Hide hint" if hint_shown else "Hint"
+        if hint_shown and hint_map is None and hint_thread is None:
+            capacities = [jug.capacity for jug in jugs]
+            hint_progress[0] = 0
+            hint_thread = threading.Thread(target=hint_worker, args=(capacities, goal_state(len(jugs), target)),
+                                           daemon=True)
+            hint_thread.start()
+
+    buttons = []
+    move_buttons = {}  # move without the amount -> its button, used to highlight hints
+    for i, jug in enumerate(jugs):
+        move_buttons[("fill", i)] = Button(100 + i*200, 500, 150, 50, f"Fill Jug {jug_letter(i)}", lambda i=i: fill_jug(i))  # Button to fill a jug
+        move_buttons[("empty", i)] = Button(100 + i*200, 560, 150, 50, f"Empty Jug {jug_letter(i)}", lambda i=i: empty_jug(i))  # Button to empty a jug
+        buttons.extend((move_buttons[("fill", i)], move_buttons[("empty", i)]))
+    for i in range(len(jugs)):
+        for j in range(len(jugs)):
+            if i != j:
+                move_buttons[("pour", i, j)] = Button(100 + i*200, 620 + j*60, 150, 50, f"Pour {jug_letter(i)} to {jug_letter(j)}", lambda i=i, j=j: pour(i, j))  # Button to pour from one jug to another
+                buttons.append(move_buttons[("pour", i, j)])
+
+    solve_button = Button(WIDTH - 200, HEIGHT - 100, 150, 50, "Solve for me", solve_problem)
+    buttons.append(solve_button)
+    cancel_button = Button(WIDTH - 200, 20, 150, 50, "Cancel", cancel_solving)  # Only shown while solving
+    hint_button = Button(WIDTH - 200, 90, 150, 50, "Hint", toggle_hint)
+    buttons.append(hint_button)
+    save_button = Button(WIDTH - 200, 20, 150, 50, "Save", save_recording)  # On the "solution" and "won" screens
+
+    game_state = "playing"
+    clock = pygame.time.Clock()
+    shown_state = game_state  # Screen currently drawn in the window
+    step_list = None  # Scrollable list of steps on the "solution" and "won" screens
+    full_redraw = True  # Redraw the whole window on the next frame
+    cancel_shown = False  # True while the Cancel button is on screen
+    moves_line = TextLine(10, 10, font)
+    target_line = TextLine(10, 50, font)
+    status_line = TextLine(10, 90, small_font)  # Solver progress or messages
+    hint_line = TextLine(10, 120, small_font)  # Moves left while hints are on
+    saved_line = TextLine(10, 20, small_font)  # Where the Save button wrote the recording
+    hinted_button = None  # Button currently highlighted as the best next move
+    hint_text = ""  # Text of the hint button when it was last drawn
+
+    while True:
+        # Sleep until something happens, unless the screen must change without input
+        if solver_thread is None and hint_thread is None and not full_redraw:
+            events = [pygame.event.wait()] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == SOLVED_EVENT:
+                solver_thread = None
+                solution = event.solution
+                solution_start = event.start
+                solver_message = event.message
+            elif event.type == HINT_EVENT:
+                hint_thread = None
+                hint_map = event.hint_map
+            elif game_state == "playing":
+                if solver_thread is None:
+                    for button in buttons:
+                        button.handle_event(event)
+                else:
+                    cancel_button.handle_event(event)  # Only cancelling is allowed while solving
+            elif step_list is not None:
+                save_button.handle_event(event)
+                step_list.handle_event(event)
+
+        dirty_rects = []  # Parts of the window that changed this frame
+
+        if game_state == "playing":
+            if full_redraw:
+                screen.fill(WHITE)
+                for button in buttons:
+                    button.draw(screen)
+
+            moves_line.set(f"Moves: {moves}")
+            target_line.set(f"Target: " + ", ".join([f"Jug {jug_letter(i)} = {target[i]}" for i in target]))
+            if solver_thread is not None:
+                status_line.set(f"Solving... {solve_progress[0]} states explored, depth {solve_progress[1]}", BLUE)
+            else:
+                status_line.set(solver_message, RED)
+
+            # Hints: look up the moves left and highlight the button of the best next move
+            best_button = None
+            if not hint_shown:
+                hint_line.set("")
+            elif hint_map is None:
+                hint_line.set(f"Preparing hint... {hint_progress[0]} states mapped", BLUE)
+            else:
+                moves_left = hint_map.moves_left(get_jug_state())
+                if moves_left is None:
+                    hint_line.set("The target can no longer be reached from here.", RED)
+                else:
+                    hint_line.set(f"{moves_left} moves left")
+                    best_move = hint_map.best_move(get_jug_state())
+                    if best_move is not None:
+                        best_button = move_buttons[best_move[:3]]
+            if best_button is not hinted_button:
+                for button in (hinted_button, best_button):
+                    if button is not None:
+                        button.color = GREEN if button is best_button else GRAY
+                        button.draw(screen)
+                        dirty_rects.append(button.rect)
+                hinted_button = best_button
+            if hint_button.text != hint_text:
+                hint_text = hint_button.text
+                hint_button.draw(screen)
+                dirty_rects.append(hint_button.rect)
+
+            for line in (moves_line, target_line, status_line, hint_line):
+                if line.dirty or full_redraw:
+                    dirty_rects.append(line.draw(screen))
+
+            # Show the Cancel button only while solving
+            if (solver_thread is not None) != cancel_shown or full_redraw:
+                cancel_shown = solver_thread is not None
+                if cancel_shown:
+                    cancel_button.draw(screen)
+                else:
+                    screen.fill(WHITE, cancel_button.rect)
+                dirty_rects.append(cancel_button.rect)
+
+            for jug in jugs:
+                if jug.dirty or full_redraw:
+                    dirty_rects.append(jug.draw(screen))
+
+            if check_win():
+                game_state = "won"
+
+        elif game_state == "solution":
+            if full_redraw:
+                screen.fill(WHITE)
+                solution_text = render_text("Solution:", font, BLACK)
+                screen.blit(solution_text, (WIDTH // 2 - 50, 50))
+                step_list = ScrollList(WIDTH // 2 - 200, 100, WIDTH // 2 + 180, HEIGHT - 120, len(solution),
+                                       lambda i: f"{i+1}. {describe_move(solution[i][0], 'Jug')}: {list(solution[i][1])}")
+                save_button.draw(screen)
+            if step_list.dirty:
+                dirty_rects.append(step_list.draw(screen))
+            if saved_line.dirty or full_redraw:
+                dirty_rects.append(saved_line.draw(screen))
+
+        elif game_state == "won":
+            if full_redraw:
+                screen.fill(WHITE)
+                win_text = render_text("You Win!", font, GREEN)
+                screen.blit(win_text, (WIDTH // 2 - 50, 50))
+
+                steps_text = render_text("Your steps:", font, BLACK)
+                screen.blit(steps_text, (WIDTH // 2 - 50, 100))
+                # Work out the moves (with amounts) from the recorded codes, now that they are shown
+                session_steps = list(replay([jug.capacity for jug in jugs], session_start, user_steps))
+                step_list = ScrollList(WIDTH // 2 - 200, 150, WIDTH // 2 + 180, HEIGHT - 170, len(session_steps),
+                                       lambda i: f"{i+1}. {describe_move(session_steps[i][0], 'Jug')}")
+                save_button.draw(screen)
+            if step_list.dirty:
+                dirty_rects.append(step_list.draw(screen))
+            if saved_line.dirty or full_redraw:
+                dirty_rects.append(saved_line.draw(screen))
+
+        # Push only the changed rectangles to the display
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        if solution and game_state == "playing":
+            game_state = "solution"
+        if game_state != shown_state:
+            shown_state = game_state
+            full_redraw = True  # Switched screens: draw the new one next
+
+        if solver_thread is not None or hint_thread is not None:
+            clock.tick(30)  # Keep the progress readout moving while the solver or hint map runs
+
+def main():
+    """
+    Entry point of the game, used by WaterWise-V3.py and the waterwise-game command.
+    """
+    init_display()
+    water_jug_game()
+
+# Start the game when this module is run directly
+if __name__ == "__main__":
+    main()
+
+# Explanation of the entire code:
+# This code implements a graphical Water Jug Problem Solver game using Pygame.
+# It consists of several main components:
+
+# 1. Imports and Initialization:
+#    - Pygame and other necessary modules are imported.
+#    - init_display() initializes Pygame, opens the window and loads the fonts; it is only
+#      called by main(), so importing the module opens no window.
+
+# 2. Constants and Global Variables:
+#    - Colors, fonts, and display dimensions are defined.
+
+# 3. Classes:
+#    - Jug: Represents a water jug with properties like capacity, current amount, and methods to draw itself.
+#    - Button: Represents clickable buttons in the game interface.
+#    - ScrollList: A scrollable list of steps that only renders the rows in view (mouse wheel,
+#      arrow keys, Page Up/Down, Home and End scroll it).
+
+# 4. Helper Functions:
+#    - solve_problem(): Uses the shared BFS engine in waterwise.solver to find the solution to the Water Jug Problem.
+#    - solve_problem() first asks waterwise.precheck whether the target is provably impossible
+#      and shows the reason instead of searching.
+#    - Otherwise solve_worker() searches in a background thread, reporting progress and honouring
+#      the Cancel button and a time/state budget, then posts SOLVED_EVENT back to the game loop.
+#    - check_win(): Checks if the current jug states match the target state.
+#    - The user's moves are kept as (op, src, dst) codes from waterwise.recording; the amounts
+#      and action text are only worked out with replay() when the "won" screen lists them.
+#    - save_recording(): The Save button on the "solution" and "won" screens writes the solution
+#      or the user's session as a compact recording, which `python -m waterwise.recording FILE`
+#      replays.
+#    - toggle_hint(): Switches hints on or off. The first time it builds a GoalMap (a backward
+#      search from the target, in a background thread) holding the moves left from every state,
+#      so afterwards "N moves left" and the highlighted best next button are simple lookups.
+
+# 5. Main Game Loop (water_jug_game()):
+#    - Sets up the game state, jugs, buttons, and other necessary variables.
+#    - Runs the main game loop, handling events, updating game state, and rendering the display.
+
+# Execution flow of the entire code:
+# 1. The module imports the necessary modules; main() (called by WaterWise-V3.py or the
+#    waterwise-game command) imports and initializes Pygame with init_display().
+# 2. Global constants and variables are defined.
+# 3. The Jug and Button classes are defined.
+# 4. Helper functions like solve() and check_win() are defined.
+# 5. The water_jug_game() function is defined, which sets up the game:
+#    a. Game variables are initialized (jugs, buttons, game state, etc.).
+#    b. The main game loop starts:
+#       - Event handling (quit, button clicks, results from the solver thread)
+#       - Game state updates
+#       - Screen rendering based on the current game state: only changed jugs and text lines are
+#         redrawn and pushed with pygame.display.update(), text surfaces are cached by render_text(),
+#         and the loop sleeps in pygame.event.wait() while nothing is happening
+#       - Checking for win condition
+#       - Displaying solution if requested
+#       - Updating the display
+# 6. main() calls the water_jug_game() function to start the game.
+# 7. The game runs until the user closes the window or the game reaches an end state.
+
+# This structure allows for an interactive, visual representation of the Water Jug Problem,
+# where users can manipulate jugs, see the solution, and play the game to reach the target state.
@@ -0,0 +1,133 @@
+"""
+Bulk generator of solvable puzzles with a chosen difficulty.
+
+For every sampled set of jug capacities, one full reachability sweep from
+empty jugs (see waterwise.reachability.DistanceMap) gives every reachable
+state grouped by its shortest distance. Targets are then drawn from the
+states at the requested depth, so every puzzle is solvable and its optimal
+solution takes exactly that many moves. One sweep serves many puzzles, so
+thousands of puzzles per second can be written for small jugs.
+
+Puzzles are written as JSON Lines in the format read by waterwise.batch:
+
+    {"id": "p1", "capacities": [7, 11, 13], "target": [0, 4, 13], "moves": 6}
+
+Usage:
+
+    python -m waterwise.generate --count 10000 --jugs 3 --max-capacity 12 --depth 8 -o puzzles.jsonl
+    python -m waterwise.generate --count 500 --depth 5-10 --seed 1
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from waterwise.reachability import DistanceMap
+
+# Capacity tuples tried in a row without finding a puzzle before giving up
+MAX_ATTEMPTS = 1000
+
+
+def sample_capacities(rng, num_jugs, min_capacity, max_capacity):
+    """
+    Returns a tuple of num_jugs random capacities between min_capacity and max_capacity.
+    """
+    return tuple(rng.randint(min_capacity, max_capacity) for _ in range(num_jugs))
+
+
+def generate_puzzles(count, num_jugs=3, min_capacity=2, max_capacity=12, min_depth=4, max_depth=None, per_map=16,
+                     rng=None):
+    """
+    Yields count puzzles as (capacities, target state, optimal moves).
+
+    Each puzzle's optimal solution from empty jugs takes between min_depth
+    and max_depth moves (no upper limit if max_depth is None). Up to per_map
+    puzzles are drawn from each capacity tuple, all at one depth, before new
+    capacities are sampled. rng is a random.Random to draw from (the random
+    module by default), so a seeded one gives the same puzzles every time.
+
+    Raises ValueError if no capacities in the range reach the requested depth.
+    """
+    rng = rng or random
+    produced = 0
+    attempts = 0
+    while produced < count:
+        capacities = sample_capacities(rng, num_jugs, min_capacity, max_capacity)
+        reach = DistanceMap(capacities)
+        deepest = reach.depth if max_depth is None else min(max_depth, reach.depth)
+        if deepest < max(min_depth, 1):
+            attempts += 1
+            if attempts >= MAX_ATTEMPTS:
+                raise ValueError(f"No {num_jugs}-jug puzzles with capacities {min_capacity}-{max_capacity} "
+                                 f"need {min_depth} or more moves")
+            continue  # These jugs cannot make puzzles this hard
+        attempts = 0
+
+        depth = rng.randint(max(min_depth, 1), deepest)
+        level = reach.states_at(depth)
+        for index in rng.sample(range(len(level)), min(per_map, count - produced, len(level))):
+            yield capacities, reach.space.decode(level[index]), depth
+            produced += 1
+
+
+def random_puzzle(num_jugs, min_capacity, max_capacity, min_depth, max_depth=None, rng=None):
+    """
+    Returns one random solvable puzzle as (capacities, target dictionary,
+    optimal moves); see generate_puzzles().
+    """
+    capacities, state, depth = next(generate_puzzles(1, num_jugs, min_capacity, max_capacity, min_depth, max_depth,
+                                                     rng=rng))
+    return capacities, {i: level for i, level in enumerate(state) if level}, depth
+
+
+def parse_depth(text):
+    """
+    Turns a --depth value, "8" or "5-10", into (min_depth, max_depth).
+    """
+    low, _, high = text.partition("-")
+    return int(low), int(high or low)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the generator.
+    """
+    parser = argparse.ArgumentParser(description="Generate solvable Water Jug puzzles of a given difficulty")
+    parser.add_argument("--count", type=int, default=1000, help="number of puzzles (default: 1000)")
+    parser.add_argument("--jugs", type=int, default=3, help="number of jugs per puzzle (default: 3)")
+    parser.add_argument("--min-capacity", type=int, default=2, help="smallest jug capacity (default: 2)")
+    parser.add_argument("--max-capacity", type=int, default=12, help="largest jug capacity (default: 12)")
+    parser.add_argument("--depth", type=parse_depth, default=(6, 6), metavar="MOVES",
+                        help="optimal number of moves, or a range such as 5-10 (default: 6)")
+    parser.add_argument("--per-map", type=int, default=16,
+                        help="puzzles drawn from each set of capacities (default: 16)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for repeatable output")
+    parser.add_argument("-o", "--output", default=None, help="file to write the puzzles to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    min_depth, max_depth = args.depth
+    puzzles = generate_puzzles(args.count, args.jugs, args.min_capacity, args.max_capacity, min_depth, max_depth,
+                               args.per_map, random.Random(args.seed))
+    output = open(args.output, "w") if args.output else sys.stdout
+    started = time.perf_counter()
+    count = 0
+    try:
+        for count, (capacities, state, depth) in enumerate(puzzles, 1):
+            output.write(json.dumps({"id": f"p{count}", "capacities": list(capacities), "target": list(state),
+                                     "moves": depth}) + "\n")
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0
+    print(f"Generated {count} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
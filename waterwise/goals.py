@@ -0,0 +1,242 @@
+"""
+Goal predicates beyond an exact target.
+
+A target dictionary {jug index: amount} asks for one exact state: every jug
+without an entry must end up empty. The goals below describe a set of states
+instead, and the search stops at the first state of the set it reaches, so
+the solution is as short as any that meets the goal:
+
+    ExactGoal(target)      the usual exact target
+    PartialGoal(target)    the listed jugs hold their amounts, the others do not matter
+    AnyJugGoal(amount)     some jug holds exactly amount litres (the classic puzzle)
+    TotalGoal(amount)      the jugs hold amount litres between them
+
+Any of them can be passed to solver.solve() in place of a target dictionary.
+For the search, a goal is compiled against the encoded state space (see
+waterwise.encoding) into a test on state codes. Partial and any-jug goals
+become a goal table of one byte per state, filled in with a few slice
+assignments, so the test is a single lookup; the others use a small
+arithmetic check on the code.
+"""
+
+from waterwise.encoding import DENSE_TABLE_LIMIT, StateSpace
+from waterwise.precheck import level_divisor, unsolvable_reason
+from waterwise.solver import coded_bfs, goal_state, jug_letter, reconstruct_coded_path
+
+
+def mark_level(table, space, jug, level, value):
+    """
+    Sets every slot of a goal table whose state has the given jug at the
+    given level to value (0 or 1). Those codes form runs of weight codes,
+    one run every weight * radix codes, so the slots are written with slice
+    assignments: one per run, or one stride per position in a run, whichever
+    takes fewer.
+    """
+    weight = space.weights[jug]
+    period = weight * space.radices[jug]
+    runs = space.size // period
+    first = level * weight
+    if weight <= runs:
+        fill = bytes([value]) * runs
+        for offset in range(weight):
+            table[first + offset::period] = fill  # the same position in every run
+    else:
+        fill = bytes([value]) * weight
+        for run in range(runs):
+            table[run * period + first:run * period + first + weight] = fill
+
+
+class Goal:
+    """
+    Base class of the goal predicates. Subclasses implement matches() and
+    may provide a faster code test, an exact state and a pre-check.
+    """
+
+    def matches(self, state):
+        """
+        Returns True if the state (a tuple of levels) meets the goal.
+        """
+        raise NotImplementedError
+
+    def exact_state(self, num_jugs):
+        """
+        Returns the only state meeting the goal, or None if more than one can.
+        Goals with an exact state are solved like a target dictionary.
+        """
+        return None
+
+    def code_test(self, space):
+        """
+        Returns a function telling whether an encoded state meets the goal.
+        """
+        decode = space.decode
+        return lambda code: self.matches(decode(code))
+
+    def unsolvable_reason(self, capacities, start, supply=None):
+        """
+        Returns a message if the goal can be ruled out without searching, or None.
+        """
+        return None
+
+
+class ExactGoal(Goal):
+    def __init__(self, target):
+        self.target = dict(target)  # jug index -> amount; other jugs must be empty
+
+    def matches(self, state):
+        return all(level == self.target.get(i, 0) for i, level in enumerate(state))
+
+    def exact_state(self, num_jugs):
+        return goal_state(num_jugs, self.target)
+
+    def code_test(self, space):
+        return space.encode(goal_state(len(space.capacities), self.target)).__eq__
+
+    def unsolvable_reason(self, capacities, start, supply=None):
+        return unsolvable_reason(capacities, self.target, start, supply)
+
+    def __repr__(self):
+        return f"ExactGoal({self.target})"
+
+
+class PartialGoal(Goal):
+    def __init__(self, target):
+        self.target = dict(target)  # jug index -> amount; other jugs may hold anything
+
+    def matches(self, state):
+        return all(state[i] == amount for i, amount in self.target.items())
+
+    def exact_state(self, num_jugs):
+        if set(self.target) != set(range(num_jugs)):
+            return None  # Some jug is free, or a listed jug does not exist (the pre-check reports that)
+        return goal_state(num_jugs, self.target)
+
+    def code_test(self, space):
+        if space.size > DENSE_TABLE_LIMIT:
+            digits = [(space.weights[i], space.radices[i], amount) for i, amount in self.target.items()]
+            return lambda code: all(code // weight % radix == amount for weight, radix, amount in digits)
+        # Start from every state and clear the ones where a listed jug holds another level
+        table = bytearray(b"\x01") * space.size
+        for i, amount in self.target.items():
+            for level in range(space.radices[i]):
+                if level != amount:
+                    mark_level(table, space, i, level, 0)
+        return table.__getitem__
+
+    def unsolvable_reason(self, capacities, start, supply=None):
+        divisor = level_divisor(capacities, start)
+        for i, amount in self.target.items():
+            if not 0 <= i < len(capacities):
+                return f"There is no Jug {jug_letter(i)}; there are only {len(capacities)} jugs."
+            if not 0 <= amount <= capacities[i]:
+                return f"Jug {jug_letter(i)} can hold between 0L and {capacities[i]}L, not {amount}L."
+            if amount % divisor:
+                return (f"Every move keeps each jug at a multiple of {divisor}L, "
+                        f"so Jug {jug_letter(i)} can never hold {amount}L.")
+        if supply is not None and sum(self.target.values()) > sum(start) + supply:
+            return (f"The target needs at least {sum(self.target.values()) - sum(start)}L more water, "
+                    f"but the supply only holds {supply}L.")
+        return None
+
+    def __repr__(self):
+        return f"PartialGoal({self.target})"
+
+
+class AnyJugGoal(Goal):
+    def __init__(self, amount):
+        self.amount = amount  # litres that one jug, whichever it is, must hold
+
+    def matches(self, state):
+        return self.amount in state
+
+    def code_test(self, space):
+        if space.size > DENSE_TABLE_LIMIT:
+            digits = [(weight, radix) for weight, radix in zip(space.weights, space.radices) if radix > self.amount]
+            return lambda code: any(code // weight % radix == self.amount for weight, radix in digits)
+        table = bytearray(space.size)
+        for i, capacity in enumerate(space.capacities):
+            if 0 <= self.amount <= capacity:
+                mark_level(table, space, i, self.amount, 1)
+        return table.__getitem__
+
+    def unsolvable_reason(self, capacities, start, supply=None):
+        if not 0 <= self.amount <= max(capacities):
+            return f"No jug can hold {self.amount}L; the largest holds {max(capacities)}L."
+        divisor = level_divisor(capacities, start)
+        if self.amount % divisor:
+            return f"Every move keeps each jug at a multiple of {divisor}L, so no jug can hold {self.amount}L."
+        if supply is not None and self.amount > sum(start) + supply:
+            return f"The jugs can never hold {self.amount}L with a supply of {supply}L."
+        return None
+
+    def __repr__(self):
+        return f"AnyJugGoal({self.amount})"
+
+
+class TotalGoal(Goal):
+    def __init__(self, amount):
+        self.amount = amount  # litres the jugs must hold between them
+
+    def matches(self, state):
+        return sum(state) == self.amount
+
+    def exact_state(self, num_jugs):
+        if self.amount == 0:
+            return (0,) * num_jugs  # Only empty jugs hold nothing
+        return None
+
+    def code_test(self, space):
+        digits = list(zip(space.weights, space.radices))
+        return lambda code: sum(code // weight % radix for weight, radix in digits) == self.amount
+
+    def unsolvable_reason(self, capacities, start, supply=None):
+        if not 0 <= self.amount <= sum(capacities):
+            return f"The jugs hold at most {sum(capacities)}L between them, not {self.amount}L."
+        divisor = level_divisor(capacities, start)
+        if self.amount % divisor:
+            return f"Every move keeps each jug at a multiple of {divisor}L, so the jugs can never hold {self.amount}L."
+        if supply is not None and self.amount > sum(start) + supply:
+            return f"The jugs can never hold {self.amount}L with a supply of {supply}L."
+        return None
+
+    def __repr__(self):
+        return f"TotalGoal({self.amount})"
+
+
+def exact_target(target, num_jugs):
+    """
+    Returns a target dictionary for targets that name one exact state (a
+    dictionary, or a Goal with an exact state), or the Goal itself otherwise.
+    """
+    if not isinstance(target, Goal):
+        return target
+    state = target.exact_state(num_jugs)
+    if state is None:
+        return target
+    return {i: level for i, level in enumerate(state) if level}
+
+
+def goal_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Finds the shortest sequence of moves from start to any state meeting the
+    goal, with a breadth-first search over packed state codes
+    (solver.coded_bfs()). Each new state is tested with the goal's compiled
+    code test as soon as it is found, so the search stops at the first depth
+    holding a match.
+
+    progress, if given, is called as progress(states found, current depth)
+    every PROGRESS_INTERVAL expanded states; it may raise
+    solver.SearchCancelled. stats, if given, is a waterwise.stats.SearchStats
+    to fill in.
+
+    Returns a list of (move, state) pairs, or None if no reachable state meets the goal.
+    """
+    if goal.matches(tuple(start)):
+        return []
+    space = StateSpace(capacities)
+    start_code = space.encode(start)
+    parents = space.new_table()  # state code -> code of the previous state
+    code = coded_bfs(space, start_code, parents, goal.code_test(space), progress=progress, stats=stats)
+    if code is None:
+        return None
+    return reconstruct_coded_path(space, parents, start_code, code)
@@ -0,0 +1,58 @@
+"""
+Streaming printers for solutions.
+
+Each printer is a generator that renders one line per step as it is
+consumed, so long solutions start printing straight away and never exist as
+a complete table in memory.
+"""
+
+import json
+
+from waterwise.solver import iter_steps, jug_letter
+
+
+def table_lines(solution, num_jugs, jug_word="jug"):
+    """
+    Yields the lines of the solution table printed by the WaterWise.py CLI.
+    """
+    separator = "-" * (40 + num_jugs * 6)
+    state_width = num_jugs * 6
+    jug_headers = " ".join(f"{jug_letter(i):^5}" for i in range(num_jugs))
+
+    yield "\nSolution:"
+    yield separator
+    yield f"{'Step':^5} | {'Action':^30} | {jug_headers}"
+    yield separator
+    steps = 0
+    for steps, action, state in iter_steps(solution, jug_word):
+        jug_state = " ".join(f"{s:3}L" for s in state)
+        yield f"{steps:^5} | {action:^30} | {jug_state:^{state_width}}"
+        yield separator
+    yield f"\nTotal number of steps: {steps}"
+
+
+def json_lines(solution, jug_word="jug"):
+    """
+    Yields one JSON object per step: {"step": n, "action": text, "state": [levels]}.
+    """
+    for number, action, state in iter_steps(solution, jug_word):
+        yield json.dumps({"step": number, "action": action, "state": list(state)})
+
+
+def stats_lines(stats, seconds=None):
+    """
+    Yields the search statistics report printed by the WaterWise.py --stats
+    option. seconds is the total time of the search, if it was measured.
+    """
+    yield "\nSearch statistics:"
+    if seconds is not None:
+        yield f"  Time:               {seconds:.4f}s"
+    yield f"  States expanded:    {stats.expanded}"
+    yield f"  States generated:   {stats.generated}"
+    yield f"  Unique states:      {stats.unique}"
+    yield f"  Duplicates skipped: {stats.duplicates}"
+    yield f"  Peak queue length:  {stats.peak_queue}"
+    if stats.levels:
+        yield f"\n  {'Depth':^5} | {'Frontier':^10} | {'Time':^10}"
+        for depth, frontier, level_seconds in stats.levels:
+            yield f"  {depth:^5} | {frontier:^10} | {level_seconds:9.4f}s"
@@ -0,0 +1,87 @@
+"""
+Constant-time checks that rule out impossible targets before any search runs.
+
+Each check is a property that every move preserves, so a target that breaks
+one of them can never be reached:
+
+1. Levels stay between 0 and the jug's capacity.
+2. Every level stays a multiple of the gcd of all capacities and all starting
+   levels, because fills, empties and pours only ever move whole multiples of it.
+3. After any move at least one jug is full or empty (the filled jug, the
+   emptied jug, or the source/destination of a pour).
+4. With a finite supply, the jugs never hold more than their starting water
+   plus the supply, since only fills add water.
+"""
+
+from math import gcd
+
+from waterwise.solver import goal_state, jug_letter
+
+
+def level_divisor(capacities, start):
+    """
+    Returns the gcd of all capacities and starting levels: every level any
+    jug can ever hold is a multiple of it.
+    """
+    divisor = 0
+    for amount in tuple(capacities) + tuple(start):
+        divisor = gcd(divisor, amount)
+    return divisor
+
+
+def start_problem(capacities, start):
+    """
+    Returns a message if the starting levels are not a valid state (a level
+    below 0 or above its jug's capacity), or None if they are.
+    """
+    for i, (level, capacity) in enumerate(zip(start, capacities)):
+        if not 0 <= level <= capacity:
+            return f"Jug {jug_letter(i)} can hold between 0L and {capacity}L, so it cannot start with {level}L."
+    return None
+
+
+def unsolvable_reason(capacities, target, start=None, supply=None):
+    """
+    Returns a message naming the invariant the target breaks, or None if the
+    pre-check cannot rule the target out (a search is still needed then).
+    target is a dictionary {jug index: amount} or a waterwise.goals goal.
+    supply is the number of litres available for filling (None for unlimited).
+    """
+    from waterwise.goals import Goal, exact_target
+
+    num_jugs = len(capacities)
+    start = tuple(start) if start is not None else (0,) * num_jugs
+    problem = start_problem(capacities, start)
+    if problem is not None:
+        return problem  # No search can start from an impossible state
+    target = exact_target(target, num_jugs)
+    if isinstance(target, Goal):
+        return target.unsolvable_reason(capacities, start, supply)  # Checks that hold for a set of states
+    goal = goal_state(num_jugs, target)
+
+    if goal == start:
+        return None
+
+    # 1. Every level must fit in its jug
+    for i in range(num_jugs):
+        if goal[i] < 0:
+            return f"Jug {jug_letter(i)} cannot hold a negative amount of water."
+        if goal[i] > capacities[i]:
+            return f"Jug {jug_letter(i)} can hold at most {capacities[i]}L, not {goal[i]}L."
+
+    # 2. Every level stays a multiple of the common divisor
+    divisor = level_divisor(capacities, start)
+    for i in range(num_jugs):
+        if goal[i] % divisor:
+            return (f"Every move keeps each jug at a multiple of {divisor}L, "
+                    f"so Jug {jug_letter(i)} can never hold {goal[i]}L.")
+
+    # 3. Every move leaves at least one jug full or empty
+    if not any(goal[i] == 0 or goal[i] == capacities[i] for i in range(num_jugs)):
+        return "Every move leaves at least one jug full or empty, but the target has none."
+
+    # 4. Only fills add water, and they draw it from the supply
+    if supply is not None and sum(goal) > sum(start) + supply:
+        return f"The target needs {sum(goal) - sum(start)}L more water, but the supply only holds {supply}L."
+
+    return None
@@ -0,0 +1,223 @@
+"""
+Full reachability maps, cached per jug capacities.
+
+A single breadth-first search from the start state already gives the shortest
+distance and a predecessor for every reachable state. DistanceMap keeps that
+result so any number of targets for the same jugs can be answered by walking
+predecessor links back, without searching again. distance_map() keeps the
+most recently used maps in a bounded LRU cache.
+
+GoalMap is the reverse: one breadth-first search backwards from a target gives
+the number of moves left from every state, which is enough to suggest the best
+next move from wherever a player currently is.
+"""
+
+import time
+from array import array
+from collections import OrderedDict, deque
+
+from waterwise.encoding import StateSpace
+from waterwise.solver import PROGRESS_INTERVAL, coded_bfs, reconstruct_coded_path, successors
+
+
+# Number of capacity tuples (and start states) whose maps are kept in memory
+CACHE_SIZE = 8
+
+# (capacities, start) -> DistanceMap, least recently used first
+cache = OrderedDict()
+
+
+class DistanceMap:
+    def __init__(self, capacities, start=None, parents=None, order=None, level_starts=None, progress=None,
+                 stats=None):
+        self.space = StateSpace(capacities)
+        self.start = tuple(start) if start is not None else (0,) * len(self.space.capacities)
+        self.start_code = self.space.encode(self.start)
+        if parents is None:
+            self.parents = self.space.new_table()  # state code -> code of the previous state
+            self.order = array(self.parents.typecode)  # reachable state codes in BFS order
+            self.level_starts = [0]  # index in self.order where each depth begins
+            self.explore(progress, stats)
+        else:
+            # Tables that were already computed, e.g. memory-mapped by waterwise.store
+            self.parents = parents
+            self.order = order
+            self.level_starts = list(level_starts)
+
+    def explore(self, progress=None, stats=None):
+        """
+        Runs one breadth-first search (solver.coded_bfs()) over every state
+        reachable from the start, recording predecessors, the order in which
+        states were discovered and where each depth begins in that order.
+        progress, if given, is called as progress(states found, depth) every
+        PROGRESS_INTERVAL expanded states; it may raise solver.SearchCancelled.
+        stats, if given, is a waterwise.stats.SearchStats to fill in.
+        """
+        coded_bfs(self.space, self.start_code, self.parents, progress=progress, stats=stats, order=self.order,
+                  level_starts=self.level_starts)
+
+    @property
+    def depth(self):
+        """
+        Number of moves needed to reach the furthest reachable state.
+        """
+        return len(self.level_starts) - 1
+
+    def states_at(self, distance):
+        """
+        Returns the encoded states whose shortest distance from the start is
+        exactly the given number of moves.
+        """
+        if not 0 <= distance <= self.depth:
+            return self.order[0:0]
+        end = self.level_starts[distance + 1] if distance < self.depth else len(self.order)
+        return self.order[self.level_starts[distance]:end]
+
+    def is_reachable(self, state):
+        """
+        Returns True if the state can be reached from the start.
+        """
+        return self.parents[self.space.encode(state)] != self.space.size
+
+    def distance(self, state):
+        """
+        Returns the minimum number of moves to reach the state, or None if it
+        is unreachable.
+        """
+        if not self.is_reachable(state):
+            return None
+        code = self.space.encode(state)
+        moves = 0
+        while code != self.start_code:
+            code = self.parents[code]
+            moves += 1
+        return moves
+
+    def nearest(self, goal):
+        """
+        Returns the shortest path to any state meeting a waterwise.goals goal,
+        or None if no reachable state does. The states are scanned in BFS
+        order, so the first match is one of the closest.
+        """
+        is_goal = goal.code_test(self.space)
+        for code in self.order:
+            if is_goal(code):
+                return reconstruct_coded_path(self.space, self.parents, self.start_code, code)
+        return None
+
+    def path_to(self, state):
+        """
+        Returns the shortest path to the state as a list of (move, state) pairs,
+        or None if it is unreachable.
+        """
+        if not self.is_reachable(state):
+            return None
+        return reconstruct_coded_path(self.space, self.parents, self.start_code, self.space.encode(state))
+
+
+class GoalMap:
+    def __init__(self, capacities, goal, start=None, progress=None, stats=None):
+        self.reach = distance_map(capacities, start, progress)  # states the player can get to
+        self.space = self.reach.space
+        self.goal = tuple(goal)
+        self.distances = self.space.new_table()  # state code -> moves left to the goal
+        self.explore(progress, stats)
+
+    def explore(self, progress=None, stats=None):
+        """
+        Runs one breadth-first search backwards from the goal over predecessor
+        moves (StateSpace.predecessor_codes()), recording how many moves each state is from it.
+        Only states reachable from the start are kept, since no others can come
+        up in play. progress, if given, is called as progress(states found,
+        depth) every PROGRESS_INTERVAL expanded states. stats, if given, is a
+        waterwise.stats.SearchStats to fill in, like DistanceMap.explore();
+        generated counts the predecessors of reachable states only.
+        """
+        space = self.space
+        distances = self.distances
+        unvisited = space.size
+        reachable = self.reach.parents
+        if not self.reach.is_reachable(self.goal):
+            return  # Every state stays unvisited: the goal cannot be reached
+
+        goal_code = space.encode(self.goal)
+        distances[goal_code] = 0
+        queue = deque([goal_code])
+        found = 1
+        expanded = 0
+        generated = 0  # predecessors that can come up in play
+        level = 0  # moves left from the states being expanded
+        level_size = 0  # states of that level expanded so far
+        level_started = time.perf_counter()
+        while queue:
+            code = queue.popleft()
+            moves = distances[code] + 1
+            if stats is not None and moves - 1 != level:
+                now = time.perf_counter()
+                stats.add_level(level_size, now - level_started)
+                level, level_size, level_started = moves - 1, 0, now
+            for previous in space.predecessor_codes(code):
+                if reachable[previous] == unvisited:
+                    continue
+                generated += 1
+                if distances[previous] == unvisited:
+                    distances[previous] = moves
+                    queue.append(previous)
+                    found += 1
+
+            expanded += 1
+            level_size += 1
+            if stats is not None:
+                stats.peak_queue = max(stats.peak_queue, len(queue))
+            if progress is not None and expanded % PROGRESS_INTERVAL == 0:
+                progress(found, moves)
+
+        if stats is not None:
+            stats.add_level(level_size, time.perf_counter() - level_started)
+            stats.expanded = expanded
+            stats.generated = generated
+            stats.unique = found
+            stats.duplicates = generated - (found - 1)
+
+    def moves_left(self, state):
+        """
+        Returns the fewest moves from the state to the goal, or None if the
+        goal cannot be reached from it.
+        """
+        moves = self.distances[self.space.encode(state)]
+        return None if moves == self.space.size else moves
+
+    def best_move(self, state):
+        """
+        Returns a move that brings the state one step closer to the goal, or
+        None if it is at the goal already or cannot reach it.
+        """
+        moves = self.moves_left(state)
+        if not moves:
+            return None
+        for move, new_state in successors(state, self.space.capacities):
+            if self.moves_left(new_state) == moves - 1:
+                return move
+        return None
+
+
+def distance_map(capacities, start=None, progress=None, stats=None):
+    """
+    Returns the DistanceMap for the given capacities and start state (all jugs
+    empty by default), building it only if it is not in the cache already.
+    The CACHE_SIZE most recently used maps are kept.
+    progress and stats are passed on to DistanceMap.explore() when a map has
+    to be built.
+    """
+    capacities = tuple(capacities)
+    start = tuple(start) if start is not None else (0,) * len(capacities)
+    key = (capacities, start)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    reach = DistanceMap(capacities, start, progress=progress, stats=stats)
+    cache[key] = reach
+    if len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+    return reach
@@ -0,0 +1,268 @@
+"""
+Compact recordings of solutions and player sessions.
+
+A recorded move is three small integers (op, src, dst):
+
+    (FILL, i, i)     fill jug i from the supply
+    (EMPTY, i, i)    pour jug i onto the ground
+    (POUR, i, j)     pour from jug i into jug j until i is empty or j is full
+
+The amount poured and every state along the way follow from the capacities
+and the start levels, so they are not stored: replay() works them out when
+the recording is read, and action text is only made when a step is shown
+(see solver.describe_move()).
+
+A Recording is saved either in binary or as a JSON mirror of the same fields.
+Binary layout (little-endian):
+
+    header   magic, version, kind (0 solution, 1 session), number of jugs,
+             number of moves, capacities, start levels, goal levels
+    moves    3 bytes per move: op, src, dst
+
+Run as a script to replay a saved recording:
+
+    python -m waterwise.recording solution.wwr
+
+waterwise.validate checks many recordings at once with NumPy.
+"""
+
+import argparse
+import json
+import struct
+
+from waterwise.goals import Goal, exact_target
+from waterwise.solver import goal_state
+
+MAGIC = b"WWRC"
+VERSION = 1
+
+# Move opcodes
+FILL = 0
+EMPTY = 1
+POUR = 2
+
+KINDS = ("solution", "session")
+
+# Fixed part of the binary header: magic, version, kind, number of jugs, number of moves
+HEADER = "<4sBBHI"
+
+
+def move_code(move):
+    """
+    Returns the (op, src, dst) code of a move tuple such as ("pour", 0, 1, 3).
+    """
+    if move[0] == "fill":
+        return (FILL, move[1], move[1])
+    if move[0] == "empty":
+        return (EMPTY, move[1], move[1])
+    return (POUR, move[1], move[2])
+
+
+def check_code(code, num_jugs):
+    """
+    Raises ValueError if an (op, src, dst) code is malformed: an unknown op,
+    a jug index outside 0..num_jugs-1, or a fill or empty whose dst is not
+    its src.
+    """
+    op, i, j = code
+    if op not in (FILL, EMPTY, POUR):
+        raise ValueError(f"Move {code} has an unknown op")
+    if not (0 <= i < num_jugs and 0 <= j < num_jugs):
+        raise ValueError(f"Move {code} names a jug outside 0..{num_jugs - 1}")
+    if op != POUR and i != j:
+        raise ValueError(f"Move {code} fills or empties one jug, so src and dst must be equal")
+
+
+def apply_code(state, code, capacities):
+    """
+    Plays one (op, src, dst) code on a state.
+    Returns (move tuple, new state), or raises ValueError if the code is
+    malformed (see check_code()) or the move is not legal in that state
+    (nothing to fill, empty or pour).
+    """
+    check_code(code, len(capacities))
+    op, i, j = code
+    levels = list(state)
+    if op == FILL and levels[i] < capacities[i]:
+        levels[i] = capacities[i]
+        return ("fill", i), tuple(levels)
+    if op == EMPTY and levels[i] > 0:
+        levels[i] = 0
+        return ("empty", i), tuple(levels)
+    if op == POUR and i != j:
+        amount = min(levels[i], capacities[j] - levels[j])
+        if amount > 0:
+            levels[i] -= amount
+            levels[j] += amount
+            return ("pour", i, j, amount), tuple(levels)
+    raise ValueError(f"Move {code} is not legal in state {list(state)}")
+
+
+def replay(capacities, start, codes):
+    """
+    Yields (move, state) for every (op, src, dst) code, starting from start.
+    The pairs are in the same form as a solution returned by solver.solve().
+    """
+    state = tuple(start)
+    for code in codes:
+        move, state = apply_code(state, code, capacities)
+        yield move, state
+
+
+class Recording:
+    def __init__(self, capacities, start, goal, moves=(), kind="solution"):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown recording kind: {kind}")
+        self.capacities = tuple(capacities)  # capacity of each jug
+        self.start = tuple(start)  # levels before the first move
+        self.goal = tuple(goal)  # levels the puzzle asks for
+        self.moves = [tuple(code) for code in moves]  # (op, src, dst) per move
+        self.kind = kind  # "solution" from the solver or "session" played by a person
+        if len(self.start) != len(self.capacities) or len(self.goal) != len(self.capacities):
+            raise ValueError("A recording needs one start and one goal level per jug")
+        for code in self.moves:
+            if len(code) != 3:
+                raise ValueError(f"Move {code} is not an (op, src, dst) code")
+            check_code(code, len(self.capacities))  # Malformed files fail when loaded, not half-way through a replay
+
+    @classmethod
+    def from_solution(cls, capacities, target, start, solution, kind="solution"):
+        """
+        Records a solution (a list of (move, state) pairs) for the target
+        dictionary {jug index: amount}. target can also be a waterwise.goals
+        goal; when more than one state meets it, the state the solution
+        reaches is recorded as the goal.
+        """
+        start = tuple(start) if start is not None else (0,) * len(capacities)
+        target = exact_target(target, len(capacities))
+        if isinstance(target, Goal):
+            goal = solution[-1][1] if solution else start
+        else:
+            goal = goal_state(len(capacities), target)
+        return cls(capacities, start, goal, [move_code(move) for move, _ in solution], kind)
+
+    def target(self):
+        """
+        Returns the goal as a target dictionary {jug index: amount}.
+        """
+        return {i: level for i, level in enumerate(self.goal) if level}
+
+    def steps(self):
+        """
+        Yields the recording as (move, state) pairs, replaying it from the start.
+        """
+        return replay(self.capacities, self.start, self.moves)
+
+    def solves(self):
+        """
+        Returns True if replaying the recording ends at the goal.
+        """
+        state = self.start
+        for _, state in self.steps():
+            pass
+        return state == self.goal
+
+    def to_bytes(self):
+        """
+        Returns the binary form of the recording.
+        """
+        num_jugs = len(self.capacities)
+        if num_jugs > 256:
+            raise ValueError("Recordings hold at most 256 jugs")
+        header = struct.pack(f"{HEADER}{3 * num_jugs}I", MAGIC, VERSION, KINDS.index(self.kind), num_jugs,
+                             len(self.moves), *self.capacities, *self.start, *self.goal)
+        return header + bytes(value for code in self.moves for value in code)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Reads a recording from its binary form. Raises ValueError if the data
+        is not a recording this version can read.
+        """
+        if len(data) < struct.calcsize(HEADER):
+            raise ValueError("Not a WaterWise recording")
+        magic, version, kind, num_jugs, num_moves = struct.unpack_from(HEADER, data)
+        if magic != MAGIC or version != VERSION or kind >= len(KINDS):
+            raise ValueError("Not a WaterWise recording")
+        offset = struct.calcsize(HEADER)
+        levels = struct.unpack_from(f"<{3 * num_jugs}I", data, offset)
+        offset += 12 * num_jugs
+        codes = data[offset:offset + 3 * num_moves]
+        if len(codes) != 3 * num_moves:
+            raise ValueError("Recording is truncated")
+        moves = [tuple(codes[k:k + 3]) for k in range(0, len(codes), 3)]
+        return cls(levels[:num_jugs], levels[num_jugs:2 * num_jugs], levels[2 * num_jugs:], moves, KINDS[kind])
+
+    def to_json(self):
+        """
+        Returns the JSON mirror of the recording, holding the same fields as the binary form.
+        """
+        return json.dumps({
+            "format": "waterwise-recording",
+            "version": VERSION,
+            "kind": self.kind,
+            "capacities": list(self.capacities),
+            "start": list(self.start),
+            "goal": list(self.goal),
+            "moves": [list(code) for code in self.moves],
+        })
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Reads a recording from its JSON mirror.
+        """
+        fields = json.loads(text)
+        if fields.get("format") != "waterwise-recording" or fields.get("version") != VERSION:
+            raise ValueError("Not a WaterWise recording")
+        return cls(fields["capacities"], fields["start"], fields["goal"], fields["moves"], fields["kind"])
+
+    def save(self, path):
+        """
+        Writes the recording to a file: the JSON mirror if the name ends in
+        .json, the binary form otherwise.
+        """
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                f.write(self.to_json() + "\n")
+        else:
+            with open(path, "wb") as f:
+                f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a recording saved with save(), in either form.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:len(MAGIC)] == MAGIC:
+            return cls.from_bytes(data)
+        return cls.from_json(data.decode("utf-8"))
+
+
+def main(argv=None):
+    """
+    Command line entry point: prints a saved recording step by step.
+    """
+    from waterwise.output import table_lines
+
+    parser = argparse.ArgumentParser(description="Replay a saved Water Jug solution or game session")
+    parser.add_argument("path", help="recording saved in binary or as JSON")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.path)
+    print(f"{recording.kind.capitalize()} for jugs {list(recording.capacities)}, "
+          f"from {list(recording.start)} to {list(recording.goal)}")
+    try:
+        for line in table_lines(recording.steps(), len(recording.capacities)):
+            print(line)
+    except ValueError as e:
+        print(f"\n{e}")  # The recording holds a move that cannot be played
+        return
+    if not recording.solves():
+        print("The recording does not reach the goal.")
+
+
+if __name__ == "__main__":
+    main()
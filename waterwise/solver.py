@@ -0,0 +1,550 @@
+"""
+Shared solver engine for the Water Jug Problem.
+
+The command line (waterwise.cli), Tkinter app (waterwise.tkapp) and Pygame
+game (waterwise.game) all use this module instead of carrying their own copy
+of the BFS. States are tuples of water levels, one
+entry per jug. Moves are small tuples:
+
+    ("fill", i)          fill jug i from the supply
+    ("empty", i)         pour jug i onto the ground
+    ("pour", i, j, n)    pour n litres from jug i into jug j
+
+Action text is only produced when a solution is displayed (see describe_move()).
+"""
+
+import time
+from collections import deque
+
+from waterwise.encoding import StateSpace
+
+# How many expanded states pass between two calls of a progress callback
+PROGRESS_INTERVAL = 4096
+
+
+class SearchCancelled(Exception):
+    """
+    Raised by a progress callback to stop a running search.
+    The message says why (cancelled by the user, out of time, ...).
+    """
+
+
+def jug_letter(i):
+    """
+    Returns the display label of jug number i: 'A' to 'Z', then 'AA', 'AB', ...
+    like spreadsheet columns, so any number of jugs can be labelled.
+    """
+    label = ""
+    i += 1
+    while i:
+        i, remainder = divmod(i - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+def describe_move(move, jug_word="jug"):
+    """
+    Turns a move tuple into the action text shown to the user.
+    jug_word lets each front end keep its own wording ("jug" or "Jug").
+    """
+    kind = move[0]
+    if kind == "fill":
+        return f"Fill {jug_word} {jug_letter(move[1])}"
+    if kind == "empty":
+        return f"Empty {jug_word} {jug_letter(move[1])}"
+    _, i, j, amount = move
+    return f"Pour {amount}L from {jug_word} {jug_letter(i)} to {jug_word} {jug_letter(j)}"
+
+
+def move_between(before, after, capacities):
+    """
+    Works out which single move turns state before into state after.
+    """
+    changed = [i for i in range(len(before)) if before[i] != after[i]]
+    if len(changed) == 1:
+        i = changed[0]
+        return ("fill", i) if after[i] == capacities[i] else ("empty", i)
+    i, j = changed
+    if after[i] > before[i]:
+        i, j = j, i  # i is the jug that lost water
+    return ("pour", i, j, before[i] - after[i])
+
+
+def goal_state(num_jugs, target):
+    """
+    Builds the goal state from a target dictionary {jug index: amount}.
+    Jugs without a target must end up empty.
+    """
+    return tuple(target.get(i, 0) for i in range(num_jugs))
+
+
+def successors(state, capacities):
+    """
+    Yields (move, new_state) for every legal move from the given state.
+    The order (fill, empty, then pours for each jug) matches the original
+    front ends, so the same shortest path is found.
+    """
+    num_jugs = len(capacities)
+    for i in range(num_jugs):
+        current = state[i]
+
+        # Fill jug
+        if current < capacities[i]:
+            yield ("fill", i), state[:i] + (capacities[i],) + state[i + 1:]
+
+        # Empty jug
+        if current > 0:
+            yield ("empty", i), state[:i] + (0,) + state[i + 1:]
+
+            # Pour to another jug
+            for j in range(num_jugs):
+                if i != j and state[j] < capacities[j]:
+                    amount = min(current, capacities[j] - state[j])
+                    new_state = list(state)
+                    new_state[i] -= amount
+                    new_state[j] += amount
+                    yield ("pour", i, j, amount), tuple(new_state)
+
+
+def predecessors(state, capacities):
+    """
+    Yields (move, previous_state) for every state that reaches the given state
+    in one move. Used to search backwards from a fully known target.
+    """
+    num_jugs = len(capacities)
+    for i in range(num_jugs):
+        current = state[i]
+
+        # Fill jug: the jug is full now and held anything less before
+        if current == capacities[i]:
+            for level in range(capacities[i]):
+                yield ("fill", i), state[:i] + (level,) + state[i + 1:]
+
+        # Empty jug: the jug is empty now and held some water before
+        if current == 0:
+            for level in range(1, capacities[i] + 1):
+                yield ("empty", i), state[:i] + (level,) + state[i + 1:]
+
+        # Pour from jug i to jug j: either the source ran dry or the destination filled up
+        for j in range(num_jugs):
+            if i != j and (current == 0 or state[j] == capacities[j]):
+                for amount in range(1, min(capacities[i] - current, state[j]) + 1):
+                    previous = list(state)
+                    previous[i] += amount
+                    previous[j] -= amount
+                    yield ("pour", i, j, amount), tuple(previous)
+
+
+def reconstruct_path(parents, state):
+    """
+    Walks the predecessor links back from the given state to the start.
+    Returns the path as a list of (move, state) pairs, start excluded.
+    """
+    path = []
+    parent, move = parents[state]
+    while parent is not None:
+        path.append((move, state))
+        state = parent
+        parent, move = parents[state]
+    path.reverse()
+    return path
+
+
+def coded_bfs(space, start_code, parents, is_goal=None, successor_codes=None, progress=None, stats=None, order=None,
+              level_starts=None):
+    """
+    Breadth-first search over packed state codes (see waterwise.encoding),
+    shared by bfs_solve(), goals.goal_solve(), symmetry.symmetric_solve()
+    and reachability.DistanceMap.explore().
+
+    parents is a table from StateSpace.new_table(); every state found gets
+    the code it was first reached from, and the start points to itself.
+    Each new state is tested with is_goal(code) as soon as it is found, so
+    the search stops at the first depth holding a match; without is_goal it
+    runs until every reachable state is found. successor_codes(code) yields
+    the codes to visit next (StateSpace.successor_codes() by default).
+
+    order and level_starts, if given, are filled in with every state found,
+    in BFS order, and the index in order where each new depth begins.
+
+    progress, if given, is called as progress(states found, current depth)
+    every PROGRESS_INTERVAL expanded states; it may raise SearchCancelled.
+    stats, if given, is a waterwise.stats.SearchStats to fill in, including
+    the size and duration of every level.
+
+    Returns the code of the first state meeting is_goal, or None if there is none.
+    """
+    if successor_codes is None:
+        successor_codes = space.successor_codes
+    if stats is not None:
+        # Count the successors outside the search loop, so searches without stats pay nothing
+        stats.generated = 0
+        expand = successor_codes
+
+        def successor_codes(code):
+            codes = list(expand(code))
+            stats.generated += len(codes)
+            return codes
+
+    unvisited = space.size
+    parents[start_code] = start_code
+    if order is not None:
+        order.append(start_code)
+    queue = deque([start_code])
+    expanded = 0  # states taken off the queue so far
+    found = 1  # states discovered so far
+    level_end = 1  # value of expanded once the current level is finished
+    depth = 0  # depth of the states being expanded
+    level_size = 1  # states in the level being expanded
+    peak_queue = 1  # longest the queue has been
+    level_started = time.perf_counter()
+
+    try:
+        while queue:
+            code = queue.popleft()
+            expanded += 1
+            for new_code in successor_codes(code):
+                if parents[new_code] != unvisited:
+                    continue  # Already discovered at the same or a smaller depth
+                parents[new_code] = code
+                found += 1
+                if order is not None:
+                    order.append(new_code)
+                if is_goal is not None and is_goal(new_code):
+                    return new_code
+                queue.append(new_code)
+            if stats is not None:
+                peak_queue = max(peak_queue, len(queue))  # the queue can peak part way through a level
+
+            if expanded == level_end:
+                if stats is not None:
+                    now = time.perf_counter()
+                    stats.add_level(level_size, now - level_started)
+                    level_started = now
+                depth += 1
+                level_end = expanded + len(queue)
+                level_size = len(queue)
+                if level_starts is not None and queue:
+                    level_starts.append(found - len(queue))  # the queue holds exactly the next level
+            if progress is not None and expanded % PROGRESS_INTERVAL == 0:
+                progress(found, depth)
+
+        return None
+    finally:
+        if stats is not None:
+            if len(stats.levels) == depth and level_size:
+                stats.add_level(level_size, time.perf_counter() - level_started)  # level the search stopped in
+            stats.expanded = expanded
+            stats.unique = found
+            stats.duplicates = stats.generated - (found - 1)
+            stats.peak_queue = max(stats.peak_queue, peak_queue, len(queue))
+
+
+def bfs_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Finds the shortest sequence of moves from start to goal using
+    breadth-first search.
+
+    States are packed into integers (see waterwise.encoding) and every state
+    keeps the code of its predecessor in a flat array, so there is no hashing
+    in the search loop and memory stays at a few bytes per possible state.
+    The path is only rebuilt once, when the goal is reached. This is
+    goals.goal_solve() for the one exact goal state.
+
+    progress, if given, is called as progress(states found, current depth)
+    every PROGRESS_INTERVAL expanded states; it may raise SearchCancelled.
+    stats, if given, is a waterwise.stats.SearchStats to fill in, including
+    the size and duration of every level.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    """
+    from waterwise.goals import ExactGoal, goal_solve
+
+    target = {i: level for i, level in enumerate(goal) if level}
+    return goal_solve(capacities, start, ExactGoal(target), progress, stats)
+
+
+def iter_coded_path(space, parents, start_code, code):
+    """
+    Walks the predecessor array back from the given state code to the start,
+    then yields the path forwards as (move, state) pairs, start excluded.
+    Only the state codes are collected up front; states and moves are
+    decoded one step at a time as the caller consumes them.
+    """
+    codes = [code]
+    while code != start_code:
+        code = int(parents[code])
+        codes.append(code)
+    codes.reverse()
+
+    before = space.decode(codes[0])
+    for code in codes[1:]:
+        after = space.decode(code)
+        yield move_between(before, after, space.capacities), after
+        before = after
+
+
+def reconstruct_coded_path(space, parents, start_code, code):
+    """
+    Returns the path from the start to the given state code as a list of
+    (move, state) pairs, start excluded.
+    """
+    return list(iter_coded_path(space, parents, start_code, code))
+
+
+def iter_steps(solution, jug_word="jug"):
+    """
+    Yields (step number, action text, state) for each move of a solution.
+    The action text is only rendered when its step is reached, so printers
+    can stream long solutions row by row.
+    """
+    for number, (move, state) in enumerate(solution, 1):
+        yield number, describe_move(move, jug_word), state
+
+
+def bidirectional_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Finds the shortest sequence of moves from start to goal by searching
+    forwards from the start and backwards from the goal at the same time.
+
+    Each round expands one whole level of the smaller frontier. Once a level
+    meets the other side, the best meeting state of that level is used, which
+    keeps the move count optimal.
+
+    progress, if given, is called as progress(states found, combined depth of
+    both searches) after every level; it may raise SearchCancelled.
+    stats, if given, is a waterwise.stats.SearchStats to fill in; its queue
+    is the two frontiers together.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    """
+    if start == goal:
+        return []  # The frontiers only look for meetings among newly found states
+    parents = {start: (None, None)}  # state -> (previous state, move taken)
+    children = {goal: (None, None)}  # state -> (next state towards goal, move taken)
+    forward_depth = {start: 0}
+    backward_depth = {goal: 0}
+    forward_frontier = [start]
+    backward_frontier = [goal]
+    levels = 0  # levels expanded so far, forwards and backwards together
+
+    while forward_frontier and backward_frontier:
+        best = None  # (total moves, meeting state)
+        if stats is not None:
+            stats.peak_queue = max(stats.peak_queue, len(forward_frontier) + len(backward_frontier))
+
+        if len(forward_frontier) <= len(backward_frontier):
+            if stats is not None:
+                stats.expanded += len(forward_frontier)
+            next_frontier = []
+            for state in forward_frontier:
+                depth = forward_depth[state] + 1
+                for move, new_state in successors(state, capacities):
+                    if new_state in parents:
+                        continue
+                    parents[new_state] = (state, move)
+                    forward_depth[new_state] = depth
+                    next_frontier.append(new_state)
+                    if new_state in children:
+                        total = depth + backward_depth[new_state]
+                        if best is None or total < best[0]:
+                            best = (total, new_state)
+            forward_frontier = next_frontier
+        else:
+            if stats is not None:
+                stats.expanded += len(backward_frontier)
+            next_frontier = []
+            for state in backward_frontier:
+                depth = backward_depth[state] + 1
+                for move, previous in predecessors(state, capacities):
+                    if previous in children:
+                        continue
+                    children[previous] = (state, move)
+                    backward_depth[previous] = depth
+                    next_frontier.append(previous)
+                    if previous in parents:
+                        total = depth + forward_depth[previous]
+                        if best is None or total < best[0]:
+                            best = (total, previous)
+            backward_frontier = next_frontier
+
+        levels += 1
+        if progress is not None:
+            progress(len(parents) + len(children), levels)
+
+        if best is not None:
+            meeting = best[1]
+            path = reconstruct_path(parents, meeting)
+            state, move = children[meeting]
+            while state is not None:
+                path.append((move, state))
+                state, move = children[state]
+            return path
+
+    return None
+
+
+def numpy_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Breadth-first search that expands a whole level at a time with NumPy
+    (see waterwise.vectorized). NumPy is only imported when this method is used.
+    """
+    from waterwise.vectorized import level_solve
+    return level_solve(capacities, start, goal, progress, stats)
+
+
+def cached_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Looks the goal up in the full reachability map of these jugs (see
+    waterwise.reachability). The map is built by one BFS the first time and
+    kept in an LRU cache, so later targets for the same jugs need no search
+    (stats then stay at zero).
+    """
+    from waterwise.reachability import distance_map
+    return distance_map(capacities, start, progress, stats).path_to(goal)
+
+
+def astar_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    A* search with an admissible heuristic (see waterwise.astar). Suited to
+    puzzles with many jugs, where a full BFS table would not fit in memory.
+    """
+    from waterwise.astar import astar_solve as search
+    return search(capacities, start, goal, progress, stats=stats)
+
+
+def bounded_solve(capacities, start, goal, progress=None, stats=None, budget=None):
+    """
+    A* that falls back to IDA* when it would use more memory than the
+    MemoryBudget allows (see waterwise.bounded).
+    """
+    from waterwise.bounded import bounded_solve as search
+    return search(capacities, start, goal, progress, stats, budget)
+
+
+def symmetric_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Breadth-first search that treats jugs with the same capacity and target
+    as interchangeable, keeping one sorted copy of each state (see
+    waterwise.symmetry). The path is mapped back onto the real jugs.
+    """
+    from waterwise.symmetry import symmetric_solve as search
+    return search(capacities, start, goal, progress, stats)
+
+
+# Search methods that can be passed to solve()
+SEARCH_METHODS = {
+    "bfs": bfs_solve,
+    "bidirectional": bidirectional_solve,
+    "numpy": numpy_solve,
+    "cached": cached_solve,
+    "astar": astar_solve,
+    "bounded": bounded_solve,
+    "symmetric": symmetric_solve,
+}
+
+
+def solve(capacities, target, start=None, method="bfs", progress=None, budget=None, supply=None, objective="moves",
+          stats=None):
+    """
+    Finds the shortest sequence of moves from start (all jugs empty by default)
+    to the target dictionary {jug index: amount}. target can also be a goal
+    from waterwise.goals, such as "any jug holds 4L" or a partial target; the
+    search then stops at the nearest state meeting it. Goals that allow more
+    than one state are searched with a BFS (or the "cached" map) whatever the
+    method.
+
+    method selects the search: "bfs", "bidirectional", "numpy", "cached",
+    "astar", "bounded" or "symmetric". All of them return a path with the
+    same, optimal number of moves; "numpy" and "cached" return exactly the
+    same path as the plain BFS (bfs_solve()). When three or more jugs share a
+    capacity and a target, "bfs" runs the "symmetric" search instead, which
+    explores each arrangement of those jugs' levels only once, so its path
+    can differ from the plain BFS path.
+
+    budget is a waterwise.bounded.MemoryBudget for the "bounded" method; it
+    sets the memory limit and records whether the search traded time for memory.
+
+    supply, if given, is the number of litres that can be drawn in total by
+    filling jugs; solutions that need more are not allowed. objective "water"
+    finds the solution drawing the fewest litres instead of the fewest moves
+    (method is not used then). See waterwise.supply.
+
+    Targets that waterwise.precheck can rule out return None without searching.
+    Raises ValueError if a start level is below 0 or above its jug's capacity.
+
+    progress, if given, is called as progress(states found, depth) while the
+    search runs. It can stop the search by raising SearchCancelled, which
+    solve() lets through to the caller.
+
+    stats, if given, is a waterwise.stats.SearchStats that the search fills in
+    with the work it did (for the "moves" objective).
+
+    Returns a list of (move, state) pairs, or None if the target is unreachable.
+    """
+    from waterwise.goals import Goal, exact_target
+    from waterwise.precheck import start_problem, unsolvable_reason
+    from waterwise.supply import OBJECTIVES, supply_solve, water_drawn, water_solve
+    from waterwise.symmetry import SYMMETRY_MIN_COPIES, symmetry_copies
+
+    if method not in SEARCH_METHODS:
+        raise ValueError(f"Unknown search method: {method}")
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+
+    capacities = tuple(capacities)
+    start = tuple(start) if start is not None else (0,) * len(capacities)
+    problem = start_problem(capacities, start)
+    if problem is not None:
+        raise ValueError(problem)  # Packed state codes cannot hold levels outside the jugs
+    target = exact_target(target, len(capacities))
+    if isinstance(target, Goal):
+        return goal_search(capacities, target, start, method, progress, supply, objective, stats)
+    goal = goal_state(len(capacities), target)
+
+    if start == goal:
+        return []
+    if unsolvable_reason(capacities, target, start, supply) is not None:
+        return None
+    if objective == "water":
+        return water_solve(capacities, start, goal, supply, progress)
+
+    if method == "bfs" and symmetry_copies(capacities, goal) >= SYMMETRY_MIN_COPIES:
+        method = "symmetric"  # Interchangeable jugs multiply the states a plain BFS would visit
+    if method == "bounded":
+        solution = bounded_solve(capacities, start, goal, progress, stats, budget)
+    else:
+        solution = SEARCH_METHODS[method](capacities, start, goal, progress, stats)
+
+    # Only search with the supply in mind when the shortest solution needs too much water
+    if supply is not None and solution is not None and water_drawn(start, solution) > supply:
+        return supply_solve(capacities, start, goal, supply, progress)
+    return solution
+
+
+def goal_search(capacities, goal, start, method, progress, supply, objective, stats):
+    """
+    solve() for goals that more than one state meets (see waterwise.goals).
+    Returns a list of (move, state) pairs, or None if no reachable state meets the goal.
+    """
+    from waterwise.goals import goal_solve
+    from waterwise.precheck import unsolvable_reason
+    from waterwise.reachability import distance_map
+    from waterwise.supply import supply_solve, water_drawn, water_solve
+
+    if unsolvable_reason(capacities, goal, start, supply) is not None:
+        return None  # Checked first: it also rejects goals naming jugs that do not exist
+    if goal.matches(start):
+        return []
+    if objective == "water":
+        return water_solve(capacities, start, None, supply, progress, is_goal=goal.matches)
+
+    if method == "cached":
+        solution = distance_map(capacities, start, progress, stats).nearest(goal)
+    else:
+        solution = goal_solve(capacities, start, goal, progress, stats)
+
+    # Only search with the supply in mind when the shortest solution needs too much water
+    if supply is not None and solution is not None and water_drawn(start, solution) > supply:
+        return supply_solve(capacities, start, None, supply, progress, is_goal=goal.matches)
+    return solution
@@ -0,0 +1,47 @@
+"""
+Search statistics and instrumentation hooks.
+
+Pass a SearchStats to solve(stats=...) and the search fills it in as it runs,
+so callers such as the benchmark suite or the --stats option of WaterWise.py
+can see how much work a search did and where its time went.
+
+The breadth-first search fills in every field. The other engines fill in the
+fields that make sense for them (at least expanded and peak_queue).
+
+To follow a search live, pass on_level: it is called as
+on_level(depth, frontier size, seconds) each time a BFS level is finished.
+"""
+
+
+class SearchStats:
+    def __init__(self, on_level=None):
+        self.expanded = 0  # states taken off the queue (or frontier) and expanded
+        self.generated = 0  # successor states produced by all expansions
+        self.unique = 0  # distinct states discovered, the start included
+        self.duplicates = 0  # generated states that had already been discovered
+        self.peak_queue = 0  # most states waiting to be expanded at any one time
+        self.levels = []  # (depth, frontier size, seconds) for every BFS level
+        self.on_level = on_level  # observer called as each level finishes
+
+    def add_level(self, frontier, seconds):
+        """
+        Records one finished BFS level and tells the observer about it.
+        """
+        depth = len(self.levels)
+        self.levels.append((depth, frontier, seconds))
+        if self.on_level is not None:
+            self.on_level(depth, frontier, seconds)
+
+    def as_dict(self):
+        """
+        Returns the statistics as a plain dictionary, e.g. for a JSON report.
+        """
+        return {
+            "expanded": self.expanded,
+            "generated": self.generated,
+            "unique": self.unique,
+            "duplicates": self.duplicates,
+            "peak_queue": self.peak_queue,
+            "levels": [{"depth": depth, "frontier": frontier, "seconds": seconds}
+                       for depth, frontier, seconds in self.levels],
+        }
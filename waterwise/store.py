@@ -0,0 +1,157 @@
+"""
+Persistent, memory-mapped solution tables.
+
+A DistanceMap (see waterwise.reachability) for a capacity tuple can be saved
+to disk once and reused by every later process. The file holds a small header
+followed by the raw predecessor and BFS-order arrays, so loading only maps the
+file into memory: nothing is deserialized, and processes that open the same
+table share its pages through the operating system.
+
+File layout (native byte order):
+
+    header   magic, version, byte order, item size, number of jugs,
+             capacities, start levels, number of reachable states,
+             number of BFS levels and the index where each level starts
+    padding  up to a multiple of 8 bytes
+    parents  one item per possible state
+    order    one item per reachable state
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+from waterwise.encoding import DENSE_TABLE_LIMIT, SparseTable, StateSpace
+from waterwise.goals import Goal, exact_target
+from waterwise.precheck import start_problem, unsolvable_reason
+from waterwise.reachability import DistanceMap, distance_map
+from waterwise.solver import goal_state, solve
+
+MAGIC = b"WWTB"
+VERSION = 1
+
+# Directory used when no other is given; can be overridden with WATERWISE_TABLES
+DEFAULT_DIRECTORY = os.environ.get("WATERWISE_TABLES", os.path.join(os.path.expanduser("~"), ".cache", "waterwise"))
+
+TYPECODES = {4: "I", 8: "Q"}  # item size -> array/memoryview format
+
+
+def table_path(capacities, start=None, directory=None):
+    """
+    Returns the file name of the table for the given capacities and start state.
+    """
+    start = tuple(start) if start is not None else (0,) * len(capacities)
+    name = "-".join(str(c) for c in capacities) + "_" + "-".join(str(level) for level in start) + ".wwt"
+    return os.path.join(directory or DEFAULT_DIRECTORY, name)
+
+
+def save_map(reach, directory=None):
+    """
+    Writes a DistanceMap to its table file and returns the file name.
+    The file is written under a temporary name first so readers never see a
+    half-written table. Maps over state spaces too large for a flat array
+    (see encoding.DENSE_TABLE_LIMIT) cannot be stored.
+    """
+    if isinstance(reach.parents, SparseTable):
+        raise ValueError("This state space is too large to store as a table")
+    capacities = reach.space.capacities
+    num_jugs = len(capacities)
+    itemsize = reach.parents.itemsize
+    byteorder = b"l" if sys.byteorder == "little" else b"b"
+    header = struct.pack(f"=4sBcBH{num_jugs}I{num_jugs}IQI{len(reach.level_starts)}Q",
+                         MAGIC, VERSION, byteorder, itemsize, num_jugs,
+                         *capacities, *reach.start, len(reach.order),
+                         len(reach.level_starts), *reach.level_starts)
+    header += b"\0" * (-len(header) % 8)
+
+    path = table_path(capacities, reach.start, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(header)
+        f.write(memoryview(reach.parents).cast("B"))
+        f.write(memoryview(reach.order).cast("B"))
+    os.replace(temporary, path)
+    return path
+
+
+def load_map(capacities, start=None, directory=None):
+    """
+    Memory-maps the stored table for the given capacities and start state.
+    Returns a DistanceMap backed by the file, or None if there is no usable
+    table (missing, or written on a machine with a different byte order).
+    """
+    capacities = tuple(capacities)
+    path = table_path(capacities, start, directory)
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None  # ValueError: empty file
+
+    offset = struct.calcsize("=4sBcBH")
+    magic, version, byteorder, itemsize, num_jugs = struct.unpack_from("=4sBcBH", data)
+    if (magic != MAGIC or version != VERSION or itemsize not in TYPECODES
+            or byteorder != (b"l" if sys.byteorder == "little" else b"b")):
+        return None
+
+    stored_capacities = struct.unpack_from(f"={num_jugs}I", data, offset)
+    offset += 4 * num_jugs
+    stored_start = struct.unpack_from(f"={num_jugs}I", data, offset)
+    offset += 4 * num_jugs
+    reachable, num_levels = struct.unpack_from("=QI", data, offset)
+    offset += struct.calcsize("=QI")
+    level_starts = struct.unpack_from(f"={num_levels}Q", data, offset)
+    offset += 8 * num_levels
+    offset += -offset % 8
+    if stored_capacities != capacities:
+        return None
+
+    size = 1
+    for capacity in capacities:
+        size *= capacity + 1
+    view = memoryview(data)
+    typecode = TYPECODES[itemsize]
+    parents = view[offset:offset + size * itemsize].cast(typecode)
+    offset += size * itemsize
+    order = view[offset:offset + reachable * itemsize].cast(typecode)
+    return DistanceMap(capacities, stored_start, parents, order, level_starts)
+
+
+def stored_solve(capacities, target, start=None, method="bfs", directory=None, populate=False, progress=None,
+                 budget=None, supply=None, objective="moves", stats=None):
+    """
+    Solves a puzzle using the stored table for these jugs when there is one.
+    target is a dictionary {jug index: amount} or a waterwise.goals goal.
+    Without a table it runs solve() with the given method, or, if populate is
+    True, builds the full reachability map, saves it for later runs and
+    answers from it. Jugs with too many states to store as a table (see
+    save_map()) are solved without one, so they never pay for a full sweep.
+    progress, budget, supply, objective and stats are passed on to the
+    search (see solve()); stats stay at zero when a table answers. Tables
+    only hold fewest-move solutions without a supply limit, so they are not
+    used when supply or objective is given.
+
+    Returns a list of (move, state) pairs, or None if the target is unreachable.
+    Raises ValueError, like solve(), if a start level does not fit its jug.
+    """
+    capacities = tuple(capacities)
+    problem = start_problem(capacities, start if start is not None else (0,) * len(capacities))
+    if problem is not None:
+        raise ValueError(problem)
+    target = exact_target(target, len(capacities))
+    if unsolvable_reason(capacities, target, start, supply) is not None:
+        return None
+    if supply is not None or objective != "moves":
+        return solve(capacities, target, start=start, method=method, progress=progress, budget=budget,
+                     supply=supply, objective=objective, stats=stats)
+    stored = load_map(capacities, start, directory)
+    if stored is None and populate and StateSpace(capacities).size <= DENSE_TABLE_LIMIT:
+        stored = distance_map(capacities, start, progress, stats)
+        save_map(stored, directory)
+    if stored is not None:
+        if isinstance(target, Goal):
+            return stored.nearest(target)  # Nearest state meeting the goal, in stored BFS order
+        return stored.path_to(goal_state(len(capacities), target))
+    return solve(capacities, target, start=start, method=method, progress=progress, budget=budget, stats=stats)
@@ -0,0 +1,145 @@
+"""
+Searches that take the water supply into account.
+
+Only fills draw water from the supply; empties and pours just move or discard
+water that is already in the jugs. Two searches are provided:
+
+- supply_solve() finds the fewest moves that never draw more than a finite
+  supply, for when the plain shortest solution needs too much water.
+- water_solve() finds the solution that draws the fewest litres. Every move
+  costs a small whole number of litres (0 up to the largest capacity), so it
+  runs Dijkstra's algorithm with a bucket queue: one FIFO bucket per cost,
+  reused in a ring, instead of a binary heap. Taking the next state is then
+  constant time and the search runs close to the speed of a plain BFS.
+"""
+
+from collections import deque
+
+from waterwise.solver import PROGRESS_INTERVAL, reconstruct_path, successors
+
+# Objectives that can be passed to solve()
+OBJECTIVES = ("moves", "water")
+
+
+def fill_cost(move, before, after):
+    """
+    Returns the litres a move draws from the supply (only fills draw any).
+    """
+    if move[0] == "fill":
+        return after[move[1]] - before[move[1]]
+    return 0
+
+
+def water_drawn(start, solution):
+    """
+    Returns the total litres a solution draws from the supply.
+    """
+    total = 0
+    state = tuple(start)
+    for move, new_state in solution:
+        total += fill_cost(move, state, new_state)
+        state = new_state
+    return total
+
+
+def supply_solve(capacities, start, goal, supply, progress=None, is_goal=None):
+    """
+    Finds the fewest moves from start to goal that draw at most supply litres.
+    is_goal, if given, is a function of a state used instead of comparing
+    with goal (see waterwise.goals).
+
+    This is a BFS over (state, litres drawn so far) pairs. A pair is skipped
+    when the same state was already reached, at no greater depth, with no
+    more water drawn, so each state is only expanded again when it is reached
+    more cheaply.
+
+    progress, if given, is called as progress(states found, depth) every
+    PROGRESS_INTERVAL expanded states; it may raise solver.SearchCancelled.
+
+    Returns a list of (move, state) pairs, or None if no solution fits the supply.
+    """
+    if is_goal is None:
+        is_goal = goal.__eq__
+    parents = {(start, 0): (None, None)}  # (state, litres) -> (previous pair, move taken)
+    least_drawn = {start: 0}  # state -> fewest litres it has been reached with
+    queue = deque([(start, 0, 0)])  # (state, litres drawn, depth)
+    expanded = 0
+
+    while queue:
+        state, drawn, depth = queue.popleft()
+        for move, new_state in successors(state, capacities):
+            new_drawn = drawn + fill_cost(move, state, new_state)
+            if new_drawn > supply or new_drawn >= least_drawn.get(new_state, new_drawn + 1):
+                continue
+            least_drawn[new_state] = new_drawn
+            parents[(new_state, new_drawn)] = ((state, drawn), move)
+            if is_goal(new_state):
+                # Walk the (state, litres) pairs back to the start
+                path = []
+                node = (new_state, new_drawn)
+                while parents[node][0] is not None:
+                    previous, step = parents[node]
+                    path.append((step, node[0]))
+                    node = previous
+                path.reverse()
+                return path
+            queue.append((new_state, new_drawn, depth + 1))
+
+        expanded += 1
+        if progress is not None and expanded % PROGRESS_INTERVAL == 0:
+            progress(len(parents), depth)
+
+    return None
+
+
+def water_solve(capacities, start, goal, supply=None, progress=None, is_goal=None):
+    """
+    Finds the solution that draws the fewest litres from the supply, using
+    Dijkstra's algorithm with a bucket queue. With a finite supply, solutions
+    that would need more than supply litres are not considered. is_goal, if
+    given, is a function of a state used instead of comparing with goal.
+
+    progress, if given, is called as progress(states found, litres drawn so
+    far) every PROGRESS_INTERVAL settled states; it may raise
+    solver.SearchCancelled.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable
+    within the supply.
+    """
+    if is_goal is None:
+        is_goal = goal.__eq__
+    width = max(capacities) + 1  # a move never costs more than the largest jug
+    buckets = [deque() for _ in range(width)]  # bucket c % width holds states costing c litres
+    parents = {start: (None, None)}  # state -> (previous state, move taken)
+    least_drawn = {start: 0}  # state -> fewest litres found so far
+    settled = set()  # states whose fewest litres are final
+    buckets[0].append(start)
+    pending = 1  # entries waiting in the buckets
+    litres = 0  # cost of the bucket being emptied
+
+    while pending:
+        bucket = buckets[litres % width]
+        while bucket:
+            state = bucket.popleft()
+            pending -= 1
+            if state in settled:
+                continue  # Stale entry: the state was settled at a lower cost
+            if is_goal(state):
+                return reconstruct_path(parents, state)
+            settled.add(state)
+
+            for move, new_state in successors(state, capacities):
+                cost = litres + fill_cost(move, state, new_state)
+                if supply is not None and cost > supply:
+                    continue
+                if cost < least_drawn.get(new_state, cost + 1):
+                    least_drawn[new_state] = cost
+                    parents[new_state] = (state, move)
+                    buckets[cost % width].append(new_state)  # free moves land in this same bucket
+                    pending += 1
+
+            if progress is not None and len(settled) % PROGRESS_INTERVAL == 0:
+                progress(len(parents), litres)
+        litres += 1
+
+    return None
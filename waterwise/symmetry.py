@@ -0,0 +1,135 @@
+"""
+Symmetry reduction for interchangeable jugs.
+
+Two jugs with the same capacity and the same target level can swap places
+without changing the puzzle: a state and the same state with those two
+levels swapped are equally far from the goal. A group of k such jugs makes
+a plain search see up to k! copies of every state. This search only keeps
+one representative of each copy, its canonical form, in which the levels of
+every group of interchangeable jugs are sorted.
+
+The path found runs between canonical states, so it is mapped back onto the
+concrete jugs afterwards: from the real start, each step takes the move
+whose result has the next canonical form. Every jug in a group has the same
+target, so the last step lands exactly on the goal.
+"""
+
+from math import factorial
+
+from waterwise.encoding import StateSpace
+from waterwise.solver import coded_bfs, successors
+
+# Fewest copies of each state (the product of k! over the groups) for which
+# solve() searches canonical states instead of running a plain BFS. Sorting
+# every new state costs more than a pair of swappable jugs saves, so the
+# reduction only pays off from a group of three jugs.
+SYMMETRY_MIN_COPIES = 6
+
+
+def interchangeable_groups(capacities, goal):
+    """
+    Returns the groups of jugs that share a capacity and a goal level, as
+    tuples of jug indices. Jugs that match no other jug are left out, so an
+    empty list means the puzzle has no symmetry to use.
+    """
+    groups = {}  # (capacity, goal level) -> jug indices
+    for i, key in enumerate(zip(capacities, goal)):
+        groups.setdefault(key, []).append(i)
+    return [tuple(jugs) for jugs in groups.values() if len(jugs) > 1]
+
+
+def symmetry_copies(capacities, goal):
+    """
+    Returns how many copies of a state the interchangeable jugs can make at
+    most: the product of k! over every group of k interchangeable jugs.
+    """
+    copies = 1
+    for group in interchangeable_groups(capacities, goal):
+        copies *= factorial(len(group))
+    return copies
+
+
+def canonical_state(state, groups):
+    """
+    Returns the representative of a state: the levels of every group of
+    interchangeable jugs are sorted from fullest to emptiest.
+    """
+    levels = list(state)
+    for group in groups:
+        for i, level in zip(group, sorted((state[i] for i in group), reverse=True)):
+            levels[i] = level
+    return tuple(levels)
+
+
+def concrete_path(capacities, start, canonical_states, groups):
+    """
+    Maps a path of canonical states back onto the real jugs. Starting from
+    the real start, each step picks the move whose resulting state has the
+    next canonical form. Returns a list of (move, state) pairs.
+    """
+    path = []
+    state = start
+    for wanted in canonical_states:
+        for move, new_state in successors(state, capacities):
+            if canonical_state(new_state, groups) == wanted:
+                path.append((move, new_state))
+                state = new_state
+                break
+    return path
+
+
+def symmetric_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Finds the shortest sequence of moves from start to goal with a
+    breadth-first search over canonical states (see canonical_state()).
+    It runs the same search as solver.bfs_solve() (solver.coded_bfs()), but
+    every new code is sorted within the groups before it is looked up.
+    Without interchangeable jugs it searches every state, like a plain BFS.
+
+    progress, if given, is called as progress(states found, current depth)
+    every PROGRESS_INTERVAL expanded states; it may raise
+    solver.SearchCancelled. stats, if given, is a waterwise.stats.SearchStats
+    to fill in; it counts canonical states only.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    """
+    groups = interchangeable_groups(capacities, goal)
+    space = StateSpace(capacities)
+    # (weight, radix) of every jug in each group, to read its level straight from a code
+    digits = [tuple((space.weights[i], space.radices[i]) for i in group) for group in groups]
+
+    def canonical_code(code):
+        """
+        Sorts the levels of every group inside a packed state code.
+        """
+        for group in digits:
+            levels = [code // weight % radix for weight, radix in group]
+            ordered = sorted(levels, reverse=True)
+            if levels != ordered:
+                for (weight, _), old, new in zip(group, levels, ordered):
+                    code += (new - old) * weight
+        return code
+
+    root = canonical_code(space.encode(start))
+    goal_code = space.encode(goal)  # already canonical: levels are equal within each group
+    if root == goal_code:
+        return []  # Only the goal itself has the goal's canonical form
+
+    def canonical_successors(code):
+        """
+        Yields the canonical codes of a state's successors.
+        """
+        return map(canonical_code, space.successor_codes(code))
+
+    parents = space.new_table()  # canonical code -> canonical code it was reached from
+    code = coded_bfs(space, root, parents, goal_code.__eq__, canonical_successors, progress, stats)
+    if code is None:
+        return None
+
+    # Walk the canonical codes back to the start, then onto the real jugs
+    canonical_states = []
+    while code != root:
+        canonical_states.append(space.decode(code))
+        code = int(parents[code])
+    canonical_states.reverse()
+    return concrete_path(capacities, start, canonical_states, groups)
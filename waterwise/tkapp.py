@@ -0,0 +1,307 @@
+import queue
+import threading
+
+from waterwise.encoding import StateSpace
+from waterwise.precheck import unsolvable_reason
+from waterwise.solver import SEARCH_METHODS, SearchCancelled, iter_steps, jug_letter
+from waterwise.store import stored_solve
+from waterwise.supply import OBJECTIVES, water_drawn
+
+# How often (in milliseconds) the window checks on the background solver
+POLL_INTERVAL = 50
+
+# Number of jug entry rows, and how many of them fit in one column block
+MAX_JUGS = 12
+JUG_ROWS = 6
+
+# The "auto" search method uses the cached reachability map for jugs with at
+# most this many states, and A* for larger ones, where a full map takes too long
+AUTO_METHOD = "auto"
+CACHED_STATE_LIMIT = 1_000_000
+
+
+def auto_method(capacities):
+    """
+    Returns the search method "auto" stands for with these jugs.
+    """
+    return "cached" if StateSpace(capacities).size <= CACHED_STATE_LIMIT else "astar"
+
+
+def water_jug_problem():
+    """
+    Main function that sets up the GUI and handles the water jug problem solving process.
+    tkinter is imported here, so importing this module does not load it.
+    """
+    import tkinter as tk
+    from tkinter import messagebox, scrolledtext
+
+    def solve_problem():
+        """
+        Function to solve the water jug problem based on user inputs.
+        It validates inputs, sets up the problem and starts the solver in the background;
+        poll_solver() displays the result once it is ready.
+        """
+        nonlocal solver_thread
+        if solver_thread is not None:
+            return  # Already solving
+
+        # Get user inputs
+        try:
+            num_jugs = int(num_jugs_entry.get())
+            if num_jugs > MAX_JUGS:
+                messagebox.showwarning("Warning", f"Maximum number of jugs is {MAX_JUGS}. Setting to {MAX_JUGS}.")
+                num_jugs = MAX_JUGS
+
+            jugs = []
+            for i in range(num_jugs):
+                capacity = int(jug_capacities[i].get())
+                jugs.append({"capacity": capacity, "current": 0})
+
+            target = {}
+            for i in range(num_jugs):
+                amount = int(target_amounts[i].get())
+                if amount > 0:
+                    target[i] = amount
+
+            # An empty supply field means an unlimited water supply
+            supply_text = supply_entry.get().strip()
+            water_supply = int(supply_text) if supply_text else None
+
+            # Rule out impossible targets instantly, then use a stored table or search with the selected method
+            capacities = [jug["capacity"] for jug in jugs]
+            reason = unsolvable_reason(capacities, target, supply=water_supply)
+            if reason:
+                show_result(None, num_jugs, reason)
+                return
+
+            # Search in a background thread so the window stays responsive
+            cancel_solve.clear()
+            solve_progress[0] = solve_progress[1] = 0
+            method = method_var.get()
+            if method == AUTO_METHOD:
+                method = auto_method(capacities)
+            solver_thread = threading.Thread(target=solve_worker, daemon=True,
+                                             args=(capacities, target, method, save_table_var.get(),
+                                                   water_supply, objective_var.get()))
+            solver_thread.start()
+            solve_button.config(state=tk.DISABLED)
+            stop_button.config(state=tk.NORMAL)
+            root.after(POLL_INTERVAL, poll_solver, num_jugs)
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid integer values for all inputs.")
+
+    def solve_worker(capacities, target, method, populate, supply, objective):
+        """
+        Runs the solver in a background thread and puts (solution, message) on
+        the results queue when it is done.
+        """
+        def report(explored, depth):
+            """
+            Progress callback: records progress for the window and stops the
+            search when the Stop button was pressed.
+            """
+            solve_progress[0] = explored
+            solve_progress[1] = depth
+            if cancel_solve.is_set():
+                raise SearchCancelled("Solving stopped.")
+
+        try:
+            solution = stored_solve(capacities, target, method=method, populate=populate, progress=report,
+                                    supply=supply, objective=objective)
+            solver_results.put((solution, None))
+        except SearchCancelled as e:
+            solver_results.put((None, str(e)))
+        except Exception as e:
+            # Anything else (e.g. a solution table that cannot be written) must still end the
+            # search, or the window would wait for this thread forever
+            solver_results.put((None, f"The solver failed: {e}"))
+
+    def poll_solver(num_jugs):
+        """
+        Checks every POLL_INTERVAL milliseconds whether the background solver has
+        finished, updating the progress indicator until it has.
+        """
+        nonlocal solver_thread
+        try:
+            solution, message = solver_results.get_nowait()
+        except queue.Empty:
+            progress_label.config(text=f"Solving... {solve_progress[0]} states explored, depth {solve_progress[1]}")
+            root.after(POLL_INTERVAL, poll_solver, num_jugs)
+            return
+
+        solver_thread = None
+        progress_label.config(text="")
+        solve_button.config(state=tk.NORMAL)
+        stop_button.config(state=tk.DISABLED)
+        show_result(solution, num_jugs, message)
+
+    def stop_solving():
+        """
+        Function to ask the background solver to stop.
+        """
+        cancel_solve.set()
+
+    def show_result(solution, num_jugs, reason=None):
+        """
+        Writes the solution (or why there is none) to the result area.
+        The whole text is built first and inserted in a single call, which is
+        much faster than inserting long solutions row by row.
+        """
+        lines = []
+        if solution is not None:
+            lines.append("Solution:\n")
+            if not solution:
+                lines.append("The jugs already meet the target, so no moves are needed.\n")
+            else:
+                # Create header for solution display
+                lines.append(f"{'Step':^5} | {'Action':^30} | {'Jug States':^{num_jugs * 5}}\n")
+                lines.append("-" * (40 + num_jugs * 5) + "\n")
+            for step, action, state in iter_steps(solution):
+                # Format jug states for display
+                jug_states = " ".join(f"{s:3d}" for s in state)
+                lines.append(f"{step:5d} | {action:30} | {jug_states:^{num_jugs * 5}}\n")
+            lines.append(f"\nTotal number of steps taken: {len(solution)}")
+            lines.append(f"\nWater drawn from the supply: {water_drawn((0,) * num_jugs, solution)}L")
+        else:
+            lines.append("No solution found for the given inputs.")
+            if reason:
+                lines.append(f"\n{reason}")
+        result_text.delete(1.0, tk.END)
+        result_text.insert(tk.END, "".join(lines))
+
+    solver_thread = None  # Background thread running the solver, None when idle
+    solver_results = queue.Queue()  # (solution, message) pairs from the solver thread
+    cancel_solve = threading.Event()  # Set to ask the solver thread to stop
+    solve_progress = [0, 0]  # States explored and current depth, updated by the solver thread
+
+    # Create main window
+    root = tk.Tk()
+    root.title("Water Jug Problem Solver")
+
+    # Create and pack widgets
+    tk.Label(root, text="Welcome to the Water Jug Problem Solver!", font=("Arial", 16)).pack(pady=10)
+
+    tk.Label(root, text="Rules:", font=("Arial", 12, "bold")).pack(anchor="w", padx=10)
+    rules = [
+        "1. You can only manipulate one jug at a time.",
+        "2. Jugs can only be completely filled, completely emptied, or have water transferred between them.",
+        "3. There are no measurement instruments available.",
+        "4. Water can be transferred between jugs or poured onto the ground.",
+        "5. By default, there's an unlimited water supply, but this can be changed."
+    ]
+    for rule in rules:
+        tk.Label(root, text=rule).pack(anchor="w", padx=20)
+
+    tk.Label(root, text=f"Number of jugs (max {MAX_JUGS}):").pack(pady=5)
+    num_jugs_entry = tk.Entry(root)
+    num_jugs_entry.pack()
+
+    jug_frame = tk.Frame(root)
+    jug_frame.pack(pady=10)
+
+    jug_capacities = []
+    target_amounts = []
+    for i in range(MAX_JUGS):
+        # Jugs are laid out in two side-by-side blocks so the window stays short
+        row = i % JUG_ROWS
+        column = 4 * (i // JUG_ROWS)
+        tk.Label(jug_frame, text=f"Jug {jug_letter(i)}:").grid(row=row, column=column, padx=5)
+        capacity_entry = tk.Entry(jug_frame, width=10)
+        capacity_entry.grid(row=row, column=column + 1, padx=5)
+        jug_capacities.append(capacity_entry)
+        
+        tk.Label(jug_frame, text="Target:").grid(row=row, column=column + 2, padx=5)
+        target_entry = tk.Entry(jug_frame, width=10)
+        target_entry.grid(row=row, column=column + 3, padx=5)
+        target_amounts.append(target_entry)
+
+    supply_frame = tk.Frame(root)
+    supply_frame.pack()
+    tk.Label(supply_frame, text="Water supply in litres (empty = unlimited):").pack(side=tk.LEFT, padx=5)
+    supply_entry = tk.Entry(supply_frame, width=10)
+    supply_entry.pack(side=tk.LEFT)
+    tk.Label(supply_frame, text="Fewest:").pack(side=tk.LEFT, padx=5)
+    objective_var = tk.StringVar(root, value="moves")  # "water" finds the solution drawing the least water
+    tk.OptionMenu(supply_frame, objective_var, *OBJECTIVES).pack(side=tk.LEFT)
+
+    method_frame = tk.Frame(root)
+    method_frame.pack()
+    tk.Label(method_frame, text="Search method:").pack(side=tk.LEFT, padx=5)
+    method_var = tk.StringVar(root, value=AUTO_METHOD)  # cached map for small jugs, A* for large ones
+    tk.OptionMenu(method_frame, method_var, AUTO_METHOD, *SEARCH_METHODS).pack(side=tk.LEFT)
+    save_table_var = tk.BooleanVar(root, value=False)
+    tk.Checkbutton(method_frame, text="Save solution table", variable=save_table_var).pack(side=tk.LEFT, padx=5)
+
+    button_frame = tk.Frame(root)
+    button_frame.pack(pady=10)
+    solve_button = tk.Button(button_frame, text="Solve", command=solve_problem)
+    solve_button.pack(side=tk.LEFT, padx=5)
+    stop_button = tk.Button(button_frame, text="Stop", command=stop_solving, state=tk.DISABLED)
+    stop_button.pack(side=tk.LEFT, padx=5)
+
+    progress_label = tk.Label(root, text="")
+    progress_label.pack()
+
+    result_text = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=80, height=20)
+    result_text.pack(padx=10, pady=10)
+
+    root.mainloop()
+
+
+def main():
+    """
+    Entry point of the Tkinter app, used by WaterWise-v2.py and the waterwise-tk command.
+    """
+    water_jug_problem()
+
+# Run the water jug problem solver when this module is run directly
+if __name__ == "__main__":
+    main()
+
+"""
+Execution flow and features of the code:
+
+1. `main()` (called by WaterWise-v2.py or the waterwise-tk command) starts the app. tkinter is only
+   imported once `water_jug_problem()` runs, so the solver package can be imported without a display.
+
+2. The main function `water_jug_problem()` is defined, which sets up the GUI for the Water Jug Problem Solver.
+
+3. Inside `water_jug_problem()`, a nested function `solve_problem()` is defined to handle the problem-solving logic.
+
+4. The GUI is created using tkinter, including:
+   - A title and welcome message
+   - Rules of the game
+   - Input fields for the number of jugs (max MAX_JUGS)
+   - Input fields for jug capacities and target amounts
+   - An input field for the water supply (empty for unlimited) and a choice between the solution with
+     the fewest moves and the one drawing the least water
+   - A choice of search method; the default "auto" reuses one cached reachability map per set of jug
+     capacities, so changing only the targets does not search again, but switches to A* once the jugs
+     have more than CACHED_STATE_LIMIT states, where building the whole map would take too long
+   - A "Save solution table" option that stores the table for these jugs on disk for later runs
+   - "Solve" and "Stop" buttons, and a progress indicator while a solve is running
+   - A text area to display the solution
+
+5. When the user clicks the "Solve" button, `solve_problem()` is called:
+   - It retrieves and validates user inputs
+   - Sets up the problem with jugs and targets
+   - Rules out impossible targets instantly with `unsolvable_reason()` from `waterwise.precheck`
+   - Answers from a stored solution table when one exists for these jugs (`waterwise.store`)
+   - Otherwise starts the search in a background thread; `poll_solver()` checks on it with `root.after`
+     and `show_result()` writes the result to the text area in one insert
+   - Calls the shared `solve()` function from `waterwise.solver` to find a solution using BFS algorithm
+   - Displays the solution or an error message in the result text area
+
+6. The `solve()` function in `waterwise.solver` uses a breadth-first search algorithm to find the shortest path to the target state:
+   - It explores all possible actions: filling a jug, emptying a jug, or transferring water between jugs
+   - It keeps one predecessor link per visited state to avoid loops
+   - If a solution is found, it walks those links back to return the path of moves to the target state
+
+7. The solution, if found, is displayed step by step in the result text area, showing each action and the resulting jug states.
+
+8. The code handles various error cases, such as invalid inputs or when no solution is found.
+
+9. The GUI remains active and responsive, even during long searches, allowing the user to solve multiple problems without restarting the application.
+
+This code provides a user-friendly interface for solving the Water Jug Problem, with clear instructions, input validation, and detailed solution output.
+"""
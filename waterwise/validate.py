@@ -0,0 +1,171 @@
+"""
+Bulk validation and replay of move sequences with NumPy.
+
+Checks many recorded move sequences (player sessions, solutions from other
+programs, ...) at once against one set of jugs. Moves are the (op, src, dst)
+codes of waterwise.recording and follow the same rules as the game:
+
+    FILL   legal if dst is src and jug src is not full; it is filled to its capacity
+    EMPTY  legal if dst is src and jug src holds water; it is emptied
+    POUR   legal if src and dst differ and some water can move; src is
+           poured into dst until src is empty or dst is full
+
+The sequences are padded into one array and replayed one step at a time,
+each step applying the move of every sequence still running with a handful
+of array operations. A sequence stops at its first illegal move, so its
+final state is the state just before that move.
+
+NumPy is needed for this module only. Run as a script to check recordings:
+
+    python -m waterwise.validate session1.wwr session2.wwr ...
+"""
+
+import argparse
+from itertools import chain
+
+import numpy as np
+
+from waterwise.recording import EMPTY, FILL, POUR, Recording
+from waterwise.solver import goal_state
+
+
+class Validation:
+    def __init__(self, valid, final, first_illegal, solved):
+        self.valid = valid  # bool array: every move of the sequence is legal
+        self.final = final  # (sequences, jugs) array: levels after the last legal move
+        self.first_illegal = first_illegal  # index of the first illegal move, -1 if there is none
+        self.solved = solved  # bool array: valid and ending at the goal (None if no goal was given)
+
+    def __len__(self):
+        return len(self.valid)
+
+
+def pack_sequences(sequences):
+    """
+    Packs a list of move sequences, each a list of (op, src, dst) codes, into
+    one array of shape (sequences, longest sequence, 3). Returns (codes,
+    lengths); the padding after each sequence is never read.
+    """
+    lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences))
+    longest = int(lengths.max()) if len(sequences) else 0
+    codes = np.zeros((len(sequences), longest, 3), dtype=np.int64)
+    total = int(lengths.sum())
+    if total:
+        values = chain.from_iterable(chain.from_iterable(sequences))  # op, src, dst of every move in turn
+        flat = np.fromiter(values, dtype=np.int64, count=3 * total).reshape(total, 3)
+        rows = np.repeat(np.arange(len(sequences)), lengths)
+        starts = np.cumsum(lengths) - lengths  # index in flat of the first move of each sequence
+        codes[rows, np.arange(total) - np.repeat(starts, lengths)] = flat
+    return codes, lengths
+
+
+def validate_sequences(capacities, sequences, start=None, target=None, lengths=None):
+    """
+    Replays many move sequences on the same jugs at once.
+
+    sequences is a list of sequences of (op, src, dst) codes, or an array of
+    shape (sequences, steps, 3) as made by pack_sequences(), in which case
+    lengths gives the number of moves of each. start is one state for every
+    sequence (all jugs empty by default) or one state per sequence. target,
+    if given, is a dictionary {jug index: amount} used to tell which
+    sequences solve the puzzle.
+
+    Returns a Validation with the validity, final state and first illegal
+    move of every sequence.
+    """
+    num_jugs = len(capacities)
+    capacity = np.asarray(capacities, dtype=np.int64)
+    if lengths is None:
+        codes, lengths = pack_sequences(sequences)
+    else:
+        codes = np.asarray(sequences, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+    count = len(lengths)
+
+    state = np.zeros((count, num_jugs), dtype=np.int64)
+    if start is not None:
+        state[:] = np.asarray(start, dtype=np.int64)
+    valid = np.ones(count, dtype=bool)
+    first_illegal = np.full(count, -1, dtype=np.int64)
+
+    for step in range(codes.shape[1]):
+        live = np.flatnonzero(valid & (lengths > step))  # sequences with a move at this step
+        if not live.size:
+            break
+        op, src, dst = codes[live, step].T
+
+        # Out-of-range jugs are read as jug A, then rejected below
+        in_range = (src >= 0) & (src < num_jugs) & (dst >= 0) & (dst < num_jugs)
+        src = np.where(in_range, src, 0)
+        dst = np.where(in_range, dst, 0)
+        source = state[live, src]
+        destination = state[live, dst]
+        amount = np.minimum(source, capacity[dst] - destination)
+
+        is_fill = (op == FILL) & (src == dst)
+        is_empty = (op == EMPTY) & (src == dst)
+        is_pour = (op == POUR) & (src != dst)
+        legal = in_range & ((is_fill & (source < capacity[src])) | (is_empty & (source > 0)) | (is_pour & (amount > 0)))
+
+        # Stop sequences at their first illegal move
+        illegal = live[~legal]
+        valid[illegal] = False
+        first_illegal[illegal] = step
+
+        # Apply the legal moves: set the source jug, then add what was poured to the destination
+        live, src, dst, source = live[legal], src[legal], dst[legal], source[legal]
+        is_fill, is_empty, is_pour = is_fill[legal], is_empty[legal], is_pour[legal]
+        amount, destination = amount[legal], destination[legal]
+        state[live, src] = np.where(is_fill, capacity[src], np.where(is_empty, 0, source - amount))
+        state[live[is_pour], dst[is_pour]] = destination[is_pour] + amount[is_pour]
+
+    solved = None
+    if target is not None:
+        goal = np.asarray(goal_state(num_jugs, target), dtype=np.int64)
+        solved = valid & (state == goal).all(axis=1)
+    return Validation(valid, state, first_illegal, solved)
+
+
+def validate_recordings(recordings):
+    """
+    Validates a list of waterwise.recording.Recording objects. Recordings
+    are grouped by their jugs and each group is checked in one batch.
+    Returns a list of (valid, final state, first illegal move, solved), one
+    per recording, in the order given.
+    """
+    groups = {}  # capacities -> indices of the recordings for those jugs
+    for index, recording in enumerate(recordings):
+        groups.setdefault(recording.capacities, []).append(index)
+
+    results = [None] * len(recordings)
+    for capacities, indices in groups.items():
+        batch = [recordings[i] for i in indices]
+        checked = validate_sequences(capacities, [r.moves for r in batch], start=[r.start for r in batch])
+        goals = np.array([r.goal for r in batch], dtype=np.int64)
+        solved = checked.valid & (checked.final == goals).all(axis=1)
+        for row, i in enumerate(indices):
+            results[i] = (bool(checked.valid[row]), tuple(int(level) for level in checked.final[row]),
+                          int(checked.first_illegal[row]), bool(solved[row]))
+    return results
+
+
+def main(argv=None):
+    """
+    Command line entry point: checks saved recordings and prints one line each.
+    """
+    parser = argparse.ArgumentParser(description="Check saved Water Jug solutions and game sessions")
+    parser.add_argument("paths", nargs="+", help="recordings saved in binary or as JSON")
+    args = parser.parse_args(argv)
+
+    recordings = [Recording.load(path) for path in args.paths]
+    for path, (valid, final, first_illegal, solved) in zip(args.paths, validate_recordings(recordings)):
+        if not valid:
+            print(f"{path}: illegal move at step {first_illegal + 1}, levels were {list(final)}")
+        elif solved:
+            print(f"{path}: solves the puzzle")
+        else:
+            print(f"{path}: legal, but ends at {list(final)} instead of the goal")
+
+
+if __name__ == "__main__":
+    main()
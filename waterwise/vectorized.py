@@ -0,0 +1,110 @@
+"""
+Level-synchronous breadth-first search built on NumPy.
+
+Instead of expanding one state at a time, each BFS level is kept as a NumPy
+array of encoded states (see waterwise.encoding). All fill, empty and pour
+successors of the whole level are generated with array operations and then
+deduplicated against the visited table in bulk.
+
+Successors are laid out in the same order as solver.successors() and every new
+state keeps the first parent that reached it, so the shortest path is exactly
+the one the plain BFS returns.
+"""
+
+import numpy as np
+
+from waterwise.encoding import DENSE_TABLE_LIMIT, StateSpace
+from waterwise.solver import bfs_solve, reconstruct_coded_path
+
+
+def expand_level(space, frontier):
+    """
+    Generates every successor of every state in the frontier array.
+    Returns (codes, valid): two arrays of shape (len(frontier), number of moves),
+    where row r holds the successors of frontier[r] in successors() order and
+    valid marks the moves that are actually legal.
+    """
+    capacities = space.capacities
+    weights = space.weights
+    num_jugs = len(capacities)
+    levels = [(frontier // weights[i]) % space.radices[i] for i in range(num_jugs)]
+
+    codes = []
+    valid = []
+    for i in range(num_jugs):
+        current = levels[i]
+
+        # Fill jug
+        codes.append(frontier + (capacities[i] - current) * weights[i])
+        valid.append(current < capacities[i])
+
+        # Empty jug
+        codes.append(frontier - current * weights[i])
+        valid.append(current > 0)
+
+        # Pour to another jug
+        for j in range(num_jugs):
+            if i != j:
+                amount = np.minimum(current, capacities[j] - levels[j])
+                codes.append(frontier + amount * (weights[j] - weights[i]))
+                valid.append(amount > 0)
+
+    return np.stack(codes, axis=1), np.stack(valid, axis=1)
+
+
+def level_solve(capacities, start, goal, progress=None, stats=None):
+    """
+    Finds the shortest sequence of moves from start to goal, expanding one
+    whole BFS level per iteration with NumPy.
+
+    progress, if given, is called as progress(states found, depth) after
+    every level; it may raise solver.SearchCancelled. stats, if given, is a
+    waterwise.stats.SearchStats to fill in; its queue is the frontier.
+
+    The visited table is one flat array over every possible state, so state
+    spaces larger than encoding.DENSE_TABLE_LIMIT are handed to the plain
+    BFS (solver.bfs_solve()), which keeps a sparse table for them instead.
+
+    Returns a list of (move, state) pairs, or None if the goal is unreachable.
+    """
+    space = StateSpace(capacities)
+    if space.size > DENSE_TABLE_LIMIT:
+        return bfs_solve(capacities, start, goal, progress, stats)
+    start_code = space.encode(start)
+    goal_code = space.encode(goal)
+    dtype = np.int32 if space.size < 2 ** 31 else np.int64
+    parents = np.full(space.size, -1, dtype=dtype)  # state code -> code of the previous state
+    parents[start_code] = start_code
+    frontier = np.array([start_code], dtype=np.int64)
+    found = 1  # states discovered so far
+    depth = 0
+
+    while frontier.size:
+        if stats is not None:
+            stats.expanded += int(frontier.size)
+            stats.peak_queue = max(stats.peak_queue, int(frontier.size))
+        codes, valid = expand_level(space, frontier)
+        num_moves = codes.shape[1]
+
+        # Keep legal moves that lead to states not seen before, in discovery order
+        positions = np.flatnonzero(valid)
+        candidates = codes.ravel()[positions]
+        unseen = parents[candidates] == -1
+        positions = positions[unseen]
+        candidates = candidates[unseen]
+
+        # The first occurrence of each new state decides its parent, like the plain BFS
+        new_codes, first = np.unique(candidates, return_index=True)
+        order = np.argsort(first)
+        new_codes = new_codes[order]
+        parents[new_codes] = frontier[positions[first[order]] // num_moves]
+
+        if parents[goal_code] != -1:
+            return reconstruct_coded_path(space, parents, start_code, goal_code)
+        frontier = new_codes
+        found += new_codes.size
+        depth += 1
+        if progress is not None:
+            progress(found, depth)
+
+    return None